@@ -50,6 +50,7 @@ type Message struct {
 	Type      MessageType       `protobuf:"varint,7,opt,name=type,proto3,enum=hub.MessageType" json:"type,omitempty"`
 	Action    string            `protobuf:"bytes,8,opt,name=action,proto3" json:"action,omitempty"`
 	Metadata  map[string]string `protobuf:"bytes,9,rep,name=metadata,proto3" json:"metadata,omitempty" protobuf_key:"bytes,1,opt,name=key" protobuf_val:"bytes,2,opt,name=value"`
+	Payload   []byte            `protobuf:"bytes,12,opt,name=payload,proto3" json:"payload,omitempty"` // Raw file bytes (avoids the ~33% base64 tax in content)
 }
 
 func (m *Message) Reset()         { *m = Message{} }
@@ -167,4 +168,4 @@ func (x *hubServiceConnectClient) Recv() (*Message, error) {
 		return nil, err
 	}
 	return m, nil
-}
\ No newline at end of file
+}
@@ -6,12 +6,17 @@ to the DeepApp gRPC Hub system.
 """
 
 import grpc
+import grpc.aio
 import json
+import logging
 import time
-import threading
-import queue
+import asyncio
+import itertools
+import concurrent.futures
+import inspect
+import signal
 import os
-import base64
+import binascii
 from datetime import datetime
 
 # Import generated proto files (you need to generate these first)
@@ -24,6 +29,72 @@ except ImportError:
     print("python -m grpc_tools.protoc -I../../proto --python_out=. --grpc_python_out=. ../../proto/hub.proto")
     raise
 
+# Prefer orjson (native, no per-message encode overhead) on the message
+# hot path; fall back to stdlib json so the dependency stays optional.
+try:
+    import orjson
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+# Message ids only need to be unique, not wall-clock accurate; a counter
+# seeded once avoids a time.time() syscall per message.
+_id_counter = itertools.count(int(time.time() * 1000000))
+
+# Hot paths log through here with lazy %s formatting; one-time banners
+# in start() stay as prints. Set level via LOG_LEVEL (default INFO).
+logger = logging.getLogger('deepapp_sdk')
+logging.basicConfig(level=os.getenv('LOG_LEVEL', 'INFO').upper())
+
+
+def _now_iso(_cache=[0, '']):
+    """datetime.now().isoformat() memoized at second granularity.
+
+    Handlers stamp every message; recomputing the ISO string only when
+    the integer second changes turns the per-message cost into an int
+    compare.
+    """
+    s = int(time.time())
+    if s != _cache[0]:
+        _cache[0] = s
+        _cache[1] = datetime.fromtimestamp(s).isoformat()
+    return _cache[1]
+
+
+def cpu_bound(func):
+    """Mark a handler as CPU-bound so it runs on the worker's executor
+    pool instead of the shared asyncio.to_thread pool. Handlers whose
+    hot work releases the GIL (numpy, cv2, ONNX Runtime) parallelize
+    across cores this way."""
+    func.cpu_bound = True
+    return func
+
+
+def _channel_options():
+    """gRPC channel tuning for long-lived bidi worker streams.
+
+    Keepalive keeps idle streams from being dropped by middleboxes, and
+    the raised message limits keep large file payloads from failing
+    with hidden RESOURCE_EXHAUSTED errors. Values are overridable per
+    deployment via environment variables.
+    """
+    max_msg = int(os.getenv('GRPC_MAX_MESSAGE_MB', '64')) * 1024 * 1024
+    return [
+        ('grpc.keepalive_time_ms', int(os.getenv('GRPC_KEEPALIVE_TIME_MS', '30000'))),
+        ('grpc.keepalive_timeout_ms', int(os.getenv('GRPC_KEEPALIVE_TIMEOUT_MS', '10000'))),
+        ('grpc.keepalive_permit_without_calls', 1),
+        ('grpc.http2.max_pings_without_data', 0),
+        ('grpc.http2.min_time_between_pings_ms', 10000),
+        ('grpc.max_send_message_length', max_msg),
+        ('grpc.max_receive_message_length', max_msg),
+        ('grpc.http2.write_buffer_size', 0),
+    ]
+
 
 class Worker:
     """Base worker class for DeepApp gRPC Hub"""
@@ -34,23 +105,62 @@ class Worker:
         self.channel = None
         self.stub = None
         self.running = False
-        self.send_queue = queue.Queue()
+        self.send_queue = None
+        self._shutdown = None
+        # Capabilities and registration payload are static per worker;
+        # serialize them once instead of on every (re)connect.
+        # Handler dispatch table: capability -> bound method, built once
+        # so per-message dispatch is a dict lookup instead of an f-string
+        # plus getattr
+        self._handlers = {
+            name[len('handle_'):]: getattr(self, name)
+            for name in dir(self)
+            if name.startswith('handle_') and callable(getattr(self, name))
+        }
+        # Executor for handlers marked @cpu_bound; sized to the machine
+        self._cpu_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=os.cpu_count()
+        )
+        # Response skeleton: constant fields are set once and copied
+        # into each outgoing message instead of rebuilding the proto
+        # keyword-by-keyword per response
+        self._response_template = hub_pb2.Message(type=hub_pb2.DIRECT)
+        setattr(self._response_template, 'from', self.worker_id)
+        self._registration_content = _json_dumps({
+            'worker_id': self.worker_id,
+            'worker_type': 'python-sdk',
+            'capabilities': self.get_capabilities(),
+            'metadata': {
+                'version': '1.0.0',
+                'description': 'Python SDK Worker',
+                'sdk': 'python-sdk'
+            }
+        })
 
     def get_capabilities(self):
         """Override this method to define your worker's capabilities"""
         return []
 
-    def start(self):
+    async def start(self):
         """Connect to gRPC Hub and start processing"""
         print(f"🐍 Starting Python Worker: {self.worker_id}")
         print(f"📡 Connecting to Hub at: {self.hub_address}")
 
+        # Bounded so a slow hub applies backpressure to handlers
+        # instead of letting responses pile up in memory.
+        # SEND_QUEUE_MAX is the tuning knob per deployment.
+        self.send_queue = asyncio.Queue(maxsize=int(os.getenv('SEND_QUEUE_MAX', '64')))
+        self._shutdown = asyncio.Event()
+        self._install_signal_handlers()
+
         try:
-            # Create gRPC channel
-            self.channel = grpc.insecure_channel(self.hub_address)
+            # Create async gRPC channel
+            self.channel = grpc.aio.insecure_channel(
+                self.hub_address, options=_channel_options()
+            )
 
             # Wait for channel to be ready
-            grpc.channel_ready_future(self.channel).result(timeout=10)
+            await asyncio.wait_for(self.channel.channel_ready(), timeout=10)
             print("✓ Connected to Hub")
 
             # Create stub
@@ -58,22 +168,20 @@ class Worker:
 
             # Start bidirectional stream
             print("📡 Starting bidirectional stream...")
-            response_stream = self.stub.Connect(self._request_generator())
+            call = self.stub.Connect(self._request_generator())
 
             print(f"✓ Registered with Hub as '{self.worker_id}'")
             print("📨 Listening for requests...\n")
 
             self.running = True
 
-            # Thread for receiving messages
-            receive_thread = threading.Thread(target=self._receive_loop, args=(response_stream,))
-            receive_thread.daemon = True
-            receive_thread.start()
+            # Task for receiving messages
+            receive_task = asyncio.ensure_future(self._receive_loop(call))
 
-            # Keep main thread alive
+            # Wait until shutdown is requested or the stream dies
             print("Worker running. Press Ctrl+C to stop.\n")
-            while self.running:
-                time.sleep(1)
+            await self._shutdown.wait()
+            receive_task.cancel()
 
         except grpc.RpcError as e:
             print(f"✗ gRPC Error: {e.code()} - {e.details()}")
@@ -84,126 +192,145 @@ class Worker:
         finally:
             self.running = False
             if self.channel:
-                self.channel.close()
+                await self.channel.close()
                 print("\n✗ Disconnected from Hub")
 
+    def _install_signal_handlers(self):
+        """Request shutdown on SIGINT/SIGTERM without busy-waiting"""
+        loop = asyncio.get_event_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self.stop)
+            except NotImplementedError:
+                # Platforms without loop signal support (e.g. Windows)
+                pass
+
     def stop(self):
         """Stop the worker"""
         print("🛑 Stopping worker...")
         self.running = False
+        if self._shutdown is not None:
+            self._shutdown.set()
+        if self.send_queue is not None:
+            # Wake up the request generator so it can exit
+            try:
+                self.send_queue.put_nowait(None)
+            except asyncio.QueueFull:
+                pass
 
-    def _request_generator(self):
+    async def _request_generator(self):
         """Generate messages to send to hub"""
         try:
-            # Send registration message first
-            capabilities = self.get_capabilities()
-
-            registration_data = {
-                'worker_id': self.worker_id,
-                'worker_type': 'python-sdk',
-                'capabilities': capabilities,
-                'metadata': {
-                    'version': '1.0.0',
-                    'description': 'Python SDK Worker',
-                    'sdk': 'python-sdk'
-                }
-            }
-
+            # Send registration message first (content pre-serialized in
+            # __init__; only id and timestamp are fresh per connect)
             register_msg = hub_pb2.Message(
-                id=f"register-{int(time.time() * 1000000)}",
-                from_=self.worker_id,
+                id=f"register-{next(_id_counter)}",
                 to="hub",
                 channel="system",
-                content=json.dumps(registration_data),
-                timestamp=datetime.now().isoformat(),
+                content=self._registration_content,
+                timestamp=_now_iso(),
                 type=hub_pb2.REGISTER
             )
+            setattr(register_msg, 'from', self.worker_id)
 
             yield register_msg
-            print("📤 Sent registration message")
+            logger.info("Sent registration message")
 
-            # Keep generator alive by continuously yielding messages
-            while self.running:
-                try:
-                    # Block until we have a message to send
-                    msg = self.send_queue.get(block=True, timeout=1.0)
-                    yield msg
-                except queue.Empty:
-                    # No message within timeout, continue loop
-                    continue
-                except Exception as e:
-                    print(f"Error in generator: {e}")
+            # Keep generator alive; block until we have a message to send
+            while True:
+                msg = await self.send_queue.get()
+                if msg is None:
+                    # Shutdown sentinel
                     break
+                yield msg
 
-        except Exception as e:
-            print(f"Generator error: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Generator error")
 
-    def _receive_loop(self, response_stream):
+    async def _receive_loop(self, call):
         """Handle incoming messages"""
         try:
-            for msg in response_stream:
+            async for msg in call:
                 if not self.running:
                     break
 
                 try:
                     msg_from = getattr(msg, 'from')
-                    print(f"📬 Received request:")
-                    print(f"   ID: {msg.id}")
-                    print(f"   From: {msg_from}")
-                    print(f"   Channel: {msg.channel}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "recv id=%s from=%s chan=%s",
+                            msg.id, msg_from, msg.channel
+                        )
 
                     # Process the message
-                    response_content = self._process_message(msg)
-
-                    # Create response
-                    response_msg = hub_pb2.Message(
-                        id=f"resp-{int(time.time() * 1000000)}",
-                        to=msg_from,
-                        channel=msg.channel,
-                        content=json.dumps(response_content),
-                        timestamp=datetime.now().isoformat(),
-                        type=hub_pb2.DIRECT
-                    )
-                    setattr(response_msg, 'from', self.worker_id)
-
-                    # Put response in send queue
-                    self.send_queue.put(response_msg)
-                    print("   ✓ Queued response\n")
-
-                except Exception as e:
-                    print(f"✗ Error processing message: {e}")
-                    import traceback
-                    traceback.print_exc()
-
+                    response_content = await self._process_message(msg)
+
+                    # Create response from the prebuilt template;
+                    # only the varying fields are assigned
+                    response_msg = hub_pb2.Message()
+                    response_msg.CopyFrom(self._response_template)
+                    response_msg.id = f"resp-{next(_id_counter)}"
+                    response_msg.to = msg_from
+                    response_msg.channel = msg.channel
+                    response_msg.content = _json_dumps(response_content)
+                    response_msg.timestamp = _now_iso()
+
+                    # Put response in send queue; block (bounded) so the
+                    # hub's consumption rate throttles us, but never hang
+                    # forever on a stalled stream
+                    try:
+                        await asyncio.wait_for(
+                            self.send_queue.put(response_msg), timeout=30
+                        )
+                        logger.debug("queued response id=%s", response_msg.id)
+                    except asyncio.TimeoutError:
+                        logger.error(
+                            "send queue full for 30s, dropping response %s",
+                            response_msg.id
+                        )
+
+                except Exception:
+                    logger.exception("Error processing message")
+
+        except asyncio.CancelledError:
+            pass
         except grpc.RpcError as e:
             if e.code() == grpc.StatusCode.CANCELLED:
-                print("Stream cancelled")
+                logger.info("Stream cancelled")
             else:
-                print(f"✗ gRPC Error: {e.code()} - {e.details()}")
-        except Exception as e:
-            print(f"✗ Receive loop error: {e}")
-            import traceback
-            traceback.print_exc()
+                logger.error("gRPC Error: %s - %s", e.code(), e.details())
+        except Exception:
+            logger.exception("Receive loop error")
         finally:
             self.running = False
-            print("Receive loop exiting...")
+            if self._shutdown is not None:
+                self._shutdown.set()
+            logger.info("Receive loop exiting...")
 
-    def _process_message(self, msg):
+    async def _process_message(self, msg):
         """Process incoming message and return response"""
         capability = msg.channel
 
-        print(f"  → Processing capability: {capability}")
+        logger.debug("processing capability: %s", capability)
 
-        # Find handler method
-        handler_method = getattr(self, f'handle_{capability}', None)
+        # Find handler method in the prebuilt dispatch table
+        handler_method = self._handlers.get(capability)
 
-        if handler_method and callable(handler_method):
+        if handler_method is not None:
             try:
-                return handler_method(msg)
+                if inspect.iscoroutinefunction(handler_method):
+                    return await handler_method(msg)
+                if getattr(handler_method, 'cpu_bound', False):
+                    # Dedicated pool so CPU-heavy handlers don't starve
+                    # the default to_thread pool
+                    loop = asyncio.get_running_loop()
+                    return await loop.run_in_executor(
+                        self._cpu_pool, handler_method, msg
+                    )
+                # Offload sync handlers off the event loop
+                return await asyncio.to_thread(handler_method, msg)
             except Exception as e:
-                print(f"✗ Error in handler {capability}: {e}")
+                logger.exception("Error in handler %s", capability)
                 return {
                     'error': str(e),
                     'status': 'failed',
@@ -220,6 +347,15 @@ class Worker:
 class SimpleWorker(Worker):
     """Example worker with basic capabilities"""
 
+    def __init__(self, worker_id=None, hub_address='localhost:50051'):
+        super().__init__(worker_id=worker_id, hub_address=hub_address)
+        # Static part of the hello response; only timestamp varies
+        self._hello_body = {
+            'message': 'Hello World from Python SDK Worker! 🐍',
+            'worker_id': self.worker_id,
+            'status': 'success'
+        }
+
     def get_capabilities(self):
         return [
             {
@@ -251,22 +387,17 @@ class SimpleWorker(Worker):
 
     def handle_hello(self, message):
         """Handle hello capability"""
-        return {
-            'message': 'Hello World from Python SDK Worker! 🐍',
-            'timestamp': datetime.now().isoformat(),
-            'worker_id': self.worker_id,
-            'status': 'success'
-        }
+        return {**self._hello_body, 'timestamp': _now_iso()}
 
     def handle_echo(self, message):
         """Handle echo capability"""
         try:
-            content = json.loads(message.content)
+            content = _json_loads(message.content)
             input_message = content.get('message', 'No message provided')
 
             return {
                 'echo': input_message,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': _now_iso(),
                 'status': 'success'
             }
         except Exception as e:
@@ -275,21 +406,25 @@ class SimpleWorker(Worker):
                 'status': 'failed'
             }
 
+    @cpu_bound
     def handle_process_file(self, message):
         """Handle file processing capability"""
         try:
-            content = json.loads(message.content)
+            content = _json_loads(message.content)
             filename = content.get('filename', 'unknown')
-            file_data = content.get('file')
-
-            if not file_data:
-                return {
-                    'error': 'No file data provided',
-                    'status': 'failed'
-                }
 
-            # Decode base64 file data
-            file_bytes = base64.b64decode(file_data)
+            # Prefer the raw bytes payload field when the hub sends one;
+            # it skips the base64 round-trip entirely
+            file_bytes = getattr(message, 'payload', b'')
+            if not file_bytes:
+                file_data = content.get('file')
+                if not file_data:
+                    return {
+                        'error': 'No file data provided',
+                        'status': 'failed'
+                    }
+                # binascii.a2b_base64 is the thin C fast path under b64decode
+                file_bytes = binascii.a2b_base64(file_data)
             file_size = len(file_bytes)
 
             # Simulate file processing
@@ -303,7 +438,7 @@ class SimpleWorker(Worker):
                 'size': file_size,
                 'processed': True,
                 'result': 'File processed successfully',
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': _now_iso(),
                 'status': 'success'
             }
         except Exception as e:
@@ -322,11 +457,11 @@ def main():
     worker = SimpleWorker(worker_id=worker_id, hub_address=hub_address)
 
     try:
-        worker.start()
+        asyncio.run(worker.start())
     except KeyboardInterrupt:
         print("\n\n✗ Shutting down...")
         worker.stop()
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
@@ -5,9 +5,37 @@ Example Python worker using the DeepApp SDK
 
 import os
 import json
-import base64
-from datetime import datetime
-from deepapp_sdk import Worker
+import binascii
+from deepapp_sdk import Worker, _now_iso, cpu_bound
+
+# Same optional orjson fast path as the SDK itself
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    _json_loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+
+# Extension -> MIME lookup, hoisted out of the handler so it is built once
+# UTF-8 continuation bytes, used to count characters in raw bytes
+_UTF8_CONTINUATION = bytes(range(0x80, 0xC0))
+
+_MIME_TYPES = {
+    'txt': 'text/plain',
+    'json': 'application/json',
+    'xml': 'application/xml',
+    'html': 'text/html',
+    'css': 'text/css',
+    'js': 'application/javascript',
+    'png': 'image/png',
+    'jpg': 'image/jpeg',
+    'jpeg': 'image/jpeg',
+    'gif': 'image/gif',
+    'pdf': 'application/pdf',
+    'zip': 'application/zip'
+}
 
 
 class ExampleWorker(Worker):
@@ -18,6 +46,12 @@ class ExampleWorker(Worker):
             worker_id=os.getenv('WORKER_ID', 'python-example-worker'),
             hub_address=os.getenv('HUB_ADDRESS', 'localhost:50051')
         )
+        # Static part of the hello response; only timestamp varies
+        self._hello_body = {
+            'message': 'Hello World from Python SDK Worker! 🐍',
+            'worker_id': self.worker_id,
+            'status': 'success'
+        }
 
     def get_capabilities(self):
         """Define the capabilities this worker provides"""
@@ -61,27 +95,22 @@ class ExampleWorker(Worker):
         """Handle hello capability"""
         print("🔍 Processing hello request")
 
-        return {
-            'message': 'Hello World from Python SDK Worker! 🐍',
-            'timestamp': datetime.now().isoformat(),
-            'worker_id': self.worker_id,
-            'status': 'success'
-        }
+        return {**self._hello_body, 'timestamp': _now_iso()}
 
     def handle_echo(self, message):
         """Handle echo capability"""
         print("🔍 Processing echo request")
 
         try:
-            content = json.loads(message.content)
+            content = _json_loads(message.content)
             input_message = content.get('message', 'No message provided')
 
             return {
                 'echo': input_message,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': _now_iso(),
                 'status': 'success'
             }
-        except json.JSONDecodeError as e:
+        except _JSONDecodeError as e:
             return {
                 'error': f'Invalid JSON input: {str(e)}',
                 'status': 'failed'
@@ -97,7 +126,7 @@ class ExampleWorker(Worker):
         print("🔍 Processing reverse_text request")
 
         try:
-            content = json.loads(message.content)
+            content = _json_loads(message.content)
             text = content.get('text', '')
 
             reversed_text = text[::-1]
@@ -105,10 +134,10 @@ class ExampleWorker(Worker):
             return {
                 'original': text,
                 'reversed': reversed_text,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': _now_iso(),
                 'status': 'success'
             }
-        except json.JSONDecodeError as e:
+        except _JSONDecodeError as e:
             return {
                 'error': f'Invalid JSON input: {str(e)}',
                 'status': 'failed'
@@ -119,29 +148,33 @@ class ExampleWorker(Worker):
                 'status': 'failed'
             }
 
+    @cpu_bound
     def handle_analyze_file(self, message):
         """Handle file analysis capability"""
         print("🔍 Processing file analysis request")
 
         try:
-            content = json.loads(message.content)
+            content = _json_loads(message.content)
             filename = content.get('filename', 'unknown')
-            file_data = content.get('file')
 
-            if not file_data:
-                return {
-                    'error': 'No file data provided',
-                    'status': 'failed'
-                }
-
-            # Decode base64 file data
-            try:
-                file_bytes = base64.b64decode(file_data)
-            except Exception as e:
-                return {
-                    'error': f'Invalid base64 file data: {str(e)}',
-                    'status': 'failed'
-                }
+            # Prefer the raw bytes payload field when the hub sends one;
+            # it skips the base64 round-trip entirely
+            file_bytes = getattr(message, 'payload', b'')
+            if not file_bytes:
+                file_data = content.get('file')
+                if not file_data:
+                    return {
+                        'error': 'No file data provided',
+                        'status': 'failed'
+                    }
+                try:
+                    # binascii.a2b_base64 is the thin C fast path under b64decode
+                    file_bytes = binascii.a2b_base64(file_data)
+                except Exception as e:
+                    return {
+                        'error': f'Invalid base64 file data: {str(e)}',
+                        'status': 'failed'
+                    }
 
             file_size = len(file_bytes)
 
@@ -153,37 +186,29 @@ class ExampleWorker(Worker):
             }
 
             # Try to detect file type from filename
-            if '.' in filename:
-                extension = filename.split('.')[-1].lower()
+            # (rpartition avoids the list allocation of split('.'))
+            _, sep, extension = filename.rpartition('.')
+            if sep:
+                extension = extension.lower()
                 analysis['extension'] = extension
-
-                # Basic MIME type detection
-                mime_types = {
-                    'txt': 'text/plain',
-                    'json': 'application/json',
-                    'xml': 'application/xml',
-                    'html': 'text/html',
-                    'css': 'text/css',
-                    'js': 'application/javascript',
-                    'png': 'image/png',
-                    'jpg': 'image/jpeg',
-                    'jpeg': 'image/jpeg',
-                    'gif': 'image/gif',
-                    'pdf': 'application/pdf',
-                    'zip': 'application/zip'
-                }
-                analysis['mime_type'] = mime_types.get(extension, 'application/octet-stream')
+                analysis['mime_type'] = _MIME_TYPES.get(extension, 'application/octet-stream')
             else:
                 analysis['mime_type'] = 'application/octet-stream'
 
-            # Additional analysis based on content
+            # Additional analysis based on content; probe only the first
+            # 4KB instead of decoding the whole file
             try:
-                # Try to decode as text
-                text_content = file_bytes.decode('utf-8', errors='ignore')
+                text_content = file_bytes[:4096].decode('utf-8', errors='ignore')
                 if text_content:
                     analysis['is_text'] = True
-                    analysis['line_count'] = len(text_content.split('\n'))
-                    analysis['char_count'] = len(text_content)
+                    analysis['line_count'] = file_bytes.count(b'\n') + 1
+                    # Character count without decoding the whole file:
+                    # UTF-8 continuation bytes (0x80-0xBF) never start
+                    # a code point, so stripping them leaves one byte
+                    # per character
+                    analysis['char_count'] = len(
+                        file_bytes.translate(None, _UTF8_CONTINUATION)
+                    )
                 else:
                     analysis['is_text'] = False
             except:
@@ -196,11 +221,11 @@ class ExampleWorker(Worker):
                 'size': file_size,
                 'mime_type': analysis.get('mime_type', 'unknown'),
                 'analysis': analysis,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': _now_iso(),
                 'status': 'success'
             }
 
-        except json.JSONDecodeError as e:
+        except _JSONDecodeError as e:
             return {
                 'error': f'Invalid JSON input: {str(e)}',
                 'status': 'failed'
@@ -215,22 +240,17 @@ class ExampleWorker(Worker):
 
 def main():
     """Main entry point"""
-    worker = ExampleWorker()
-
-    # Handle graceful shutdown
-    import signal
+    import asyncio
     import sys
 
-    def signal_handler(sig, frame):
-        print('\n🛑 Received shutdown signal, stopping worker...')
-        worker.stop()
-        sys.exit(0)
-
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    worker = ExampleWorker()
 
+    # Graceful shutdown on SIGINT/SIGTERM is installed by Worker.start()
     try:
-        worker.start()
+        asyncio.run(worker.start())
+    except KeyboardInterrupt:
+        print('\n🛑 Received shutdown signal, stopping worker...')
+        worker.stop()
     except Exception as e:
         print(f"Failed to start worker: {e}")
         sys.exit(1)
@@ -4,13 +4,14 @@ VietOCR Worker - gRPC Client
 Kết nối tới DeepApp Hub và xử lý OCR requests
 """
 
+import asyncio
 import grpc
+import itertools
 import json
 import time
 import sys
 import os
 import uuid
-import threading
 from datetime import datetime
 
 # Import generated proto files from parent
@@ -18,9 +19,95 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../python-worker'))
 import hub_pb2
 import hub_pb2_grpc
 
+# Thread placement for the OpenMP/MLAS pools must be in the environment
+# before onnxruntime loads (it is imported lazily inside vietocr_onnx,
+# so module import time here is early enough). 'close'/'cores' keeps
+# inference threads from migrating across cores and trashing L2.
+os.environ.setdefault('OMP_PROC_BIND', 'close')
+os.environ.setdefault('OMP_PLACES', 'cores')
+
 # Import VietOCR ONNX inference
 from vietocr_onnx import VietOCR_ONNX
 
+# orjson on the per-message hot path (3-10x stdlib json); optional, so
+# fall back to stdlib when not installed. Registration stays on stdlib
+# json since it runs once per connect.
+try:
+    import orjson
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+
+# Capability metadata is constant, so build it (schemas included) once
+# at import instead of re-running json.dumps per (re)connect
+_CAPABILITIES = [
+    {
+        "name": "ocr_detect",
+        "description": "OCR nhận diện text từ ảnh (Vietnamese + English)",
+        "input_schema": json.dumps({
+            "type": "object",
+            "properties": {
+                "image": {"type": "string", "description": "Base64 encoded image"}
+            },
+            "required": ["image"]
+        }),
+        "output_schema": json.dumps({
+            "type": "object",
+            "properties": {
+                "text": {"type": "string"},
+                "confidence": {"type": "number"},
+                "processing_time_ms": {"type": "number"}
+            }
+        }),
+        "http_method": "POST",
+        "accepts_file": True,
+        "file_field_name": "image"
+    },
+    {
+        "name": "ocr_batch",
+        "description": "Batch OCR processing cho nhiều ảnh",
+        "input_schema": json.dumps({
+            "type": "object",
+            "properties": {
+                "images": {
+                    "type": "array",
+                    "items": {"type": "string"}
+                }
+            },
+            "required": ["images"]
+        }),
+        "output_schema": json.dumps({
+            "type": "object",
+            "properties": {
+                "results": {"type": "array"},
+                "total_processing_time_ms": {"type": "number"}
+            }
+        }),
+        "http_method": "POST",
+        "accepts_file": False
+    }
+]
+
+
+def _now_iso(_cache=[0, '']):
+    """ISO timestamp memoized per second.
+
+    datetime.now().isoformat() costs a syscall plus string formatting per
+    call; the hub only needs second granularity, so reformat at most once
+    a second.
+    """
+    now = int(time.time())
+    if now != _cache[0]:
+        _cache[0] = now
+        _cache[1] = datetime.now().isoformat()
+    return _cache[1]
+
 
 class VietOCRWorker:
     """VietOCR Worker với gRPC Hub integration"""
@@ -39,7 +126,43 @@ class VietOCRWorker:
         self.stub = None
         self.running = False
         self.send_queue = None
-        
+        self._shutdown = None
+
+        # Optionally pin the process to a stable core subset (e.g.
+        # WORKER_CORES=0,1,2,3) so the scheduler cannot migrate OCR
+        # threads across NUMA nodes mid-inference. Linux only.
+        cores = os.getenv('WORKER_CORES')
+        if cores and hasattr(os, 'sched_setaffinity'):
+            try:
+                os.sched_setaffinity(0, {int(c) for c in cores.split(',')})
+                print(f"✓ Pinned to cores: {cores}")
+            except (ValueError, OSError) as e:
+                print(f"⚠️  Could not set CPU affinity ({cores}): {e}")
+        # Monotonic message ids: time.time()*1e6 can collide on coarse
+        # clocks when two messages are built in the same microsecond.
+        # The uuid fragment keeps ids unique across worker restarts.
+        self._msg_seq = itertools.count()
+        self._id_prefix = f"{worker_id}-{uuid.uuid4().hex[:8]}-"
+        # Registration content is static per worker instance; serialize
+        # once here so reconnects just resend the cached string
+        self._registration_content = json.dumps({
+            "worker_id": self.worker_id,
+            "worker_type": "python-vietocr",
+            "capabilities": _CAPABILITIES,
+            "metadata": {
+                "version": "1.0.0",
+                "description": "VietOCR ONNX Worker - Vietnamese OCR",
+                "language": "Vietnamese + English",
+                "engine": "ONNX Runtime"
+            }
+        })
+        # Dispatch table built once; process_message does a single
+        # dict lookup per message instead of rebuilding bound methods
+        self._handlers = {
+            'ocr_detect': self.handle_ocr_detect,
+            'ocr_batch': self.handle_ocr_batch,
+        }
+
         # Initialize VietOCR (chỉ nếu có models)
         if encoder_path and decoder_path and os.path.exists(encoder_path) and os.path.exists(decoder_path):
             print(f"🔧 Initializing VietOCR ONNX...")
@@ -60,8 +183,12 @@ class VietOCRWorker:
         
         try:
             start_time = time.time()
-            content = json.loads(msg.content)
-            image_data = content.get('image')
+            # Raw bytes in the payload field skip the json/base64 decode
+            # passes over the image entirely
+            image_data = getattr(msg, 'payload', b'')
+            if not image_data:
+                content = _json_loads(msg.content)
+                image_data = content.get('image')
             
             if not image_data:
                 raise ValueError("Missing 'image' field")
@@ -85,11 +212,11 @@ class VietOCRWorker:
             }
             
             print(f"  ✓ OCR result: '{text[:50]}...' (conf: {confidence:.3f}, time: {processing_time:.1f}ms)")
-            return json.dumps(response_data)
+            return _json_dumps(response_data)
             
         except Exception as e:
             print(f"  ✗ OCR error: {e}")
-            return json.dumps({
+            return _json_dumps({
                 "status": "error",
                 "error": str(e),
                 "worker_id": self.worker_id
@@ -102,7 +229,7 @@ class VietOCRWorker:
         
         try:
             start_time = time.time()
-            content = json.loads(msg.content)
+            content = _json_loads(msg.content)
             images = content.get('images', [])
             
             if not images:
@@ -111,25 +238,33 @@ class VietOCRWorker:
             print(f"  📦 Processing {len(images)} images...")
             
             results = []
-            for idx, image_data in enumerate(images):
-                try:
-                    if self.ocr:
-                        text, confidence = self.ocr.predict(image_data, return_prob=True)
-                    else:
-                        text = f"Demo text {idx+1}"
-                        confidence = 0.90
-                    
+            if self.ocr:
+                # One batched call: images are width-bucketed and each
+                # bucket shares a single encoder run plus one masked
+                # greedy decode, instead of N full predict() passes
+                for idx, result in enumerate(self.ocr.predict_batch(images)):
+                    if result is None:
+                        # predict_batch marks failed entries as None;
+                        # ("", 0.0) is a legitimately blank image
+                        results.append({
+                            "text": "",
+                            "confidence": 0.0,
+                            "index": idx,
+                            "error": "OCR failed"
+                        })
+                        continue
+                    text, confidence = result
                     results.append({
                         "text": text,
                         "confidence": float(confidence),
                         "index": idx
                     })
-                except Exception as e:
+            else:
+                for idx in range(len(images)):
                     results.append({
-                        "text": "",
-                        "confidence": 0.0,
-                        "index": idx,
-                        "error": str(e)
+                        "text": f"Demo text {idx+1}",
+                        "confidence": 0.90,
+                        "index": idx
                     })
             
             processing_time = (time.time() - start_time) * 1000
@@ -144,11 +279,11 @@ class VietOCRWorker:
             }
             
             print(f"  ✓ Batch complete: {len(results)} images in {processing_time:.1f}ms")
-            return json.dumps(response_data)
+            return _json_dumps(response_data)
             
         except Exception as e:
             print(f"  ✗ Batch error: {e}")
-            return json.dumps({
+            return _json_dumps({
                 "status": "error",
                 "error": str(e),
                 "worker_id": self.worker_id
@@ -159,191 +294,70 @@ class VietOCRWorker:
         capability = msg.metadata.get('capability', msg.channel)
         
         print(f"📨 Processing capability: {capability}")
-        
-        handlers = {
-            'ocr_detect': self.handle_ocr_detect,
-            'ocr_batch': self.handle_ocr_batch,
-        }
-        
-        handler = handlers.get(capability)
+
+        handler = self._handlers.get(capability)
         if handler:
             return handler(msg)
         else:
-            return json.dumps({
+            return _json_dumps({
                 "status": "error",
                 "error": f"Unknown capability: {capability}",
                 "worker_id": self.worker_id
             })
     
-    def connect_and_run(self):
-        """Connect to Hub and start processing"""
+    async def connect_and_run(self):
+        """Connect to Hub and start processing (grpc.aio)"""
         print(f"🐍 VietOCR Worker (Python + ONNX)")
         print(f"=" * 60)
         print(f"Worker ID: {self.worker_id}")
         print(f"Hub Address: {self.hub_address}")
         print(f"=" * 60)
-        
+
+        self.send_queue = asyncio.Queue(maxsize=int(os.getenv('SEND_QUEUE_MAX', '64')))
+        self._shutdown = asyncio.Event()
+
         try:
-            # Connect to Hub
+            # Connect to Hub. A single Connect stream is the protocol:
+            # the hub keys the worker by this stream, so a multi-channel
+            # pool would just register duplicates. A local subchannel
+            # pool at least gives this process its own TCP connection
+            # instead of sharing one per-target globally, and keepalive
+            # plus raised message limits keep long-lived streams with
+            # large image payloads healthy.
             print(f"Connecting to gRPC Hub...")
-            self.channel = grpc.insecure_channel(self.hub_address)
-            grpc.channel_ready_future(self.channel).result(timeout=10)
+            max_msg = int(os.getenv('GRPC_MAX_MESSAGE_MB', '64')) * 1024 * 1024
+            self.channel = grpc.aio.insecure_channel(
+                self.hub_address,
+                options=[
+                    ('grpc.use_local_subchannel_pool', 1),
+                    ('grpc.keepalive_time_ms', 30000),
+                    ('grpc.keepalive_timeout_ms', 10000),
+                    ('grpc.keepalive_permit_without_calls', 1),
+                    ('grpc.max_send_message_length', max_msg),
+                    ('grpc.max_receive_message_length', max_msg),
+                ],
+            )
+            await asyncio.wait_for(self.channel.channel_ready(), timeout=10)
             print(f"✓ Connected to Hub")
-            
+
             # Create stub
             self.stub = hub_pb2_grpc.HubServiceStub(self.channel)
-            
-            # Create send queue
-            import queue
-            send_queue = queue.Queue()
-            self.send_queue = send_queue
-            
-            # Request generator
-            def request_generator():
-                try:
-                    # Send registration
-                    capabilities = [
-                        {
-                            "name": "ocr_detect",
-                            "description": "OCR nhận diện text từ ảnh (Vietnamese + English)",
-                            "input_schema": json.dumps({
-                                "type": "object",
-                                "properties": {
-                                    "image": {"type": "string", "description": "Base64 encoded image"}
-                                },
-                                "required": ["image"]
-                            }),
-                            "output_schema": json.dumps({
-                                "type": "object",
-                                "properties": {
-                                    "text": {"type": "string"},
-                                    "confidence": {"type": "number"},
-                                    "processing_time_ms": {"type": "number"}
-                                }
-                            }),
-                            "http_method": "POST",
-                            "accepts_file": True,
-                            "file_field_name": "image"
-                        },
-                        {
-                            "name": "ocr_batch",
-                            "description": "Batch OCR processing cho nhiều ảnh",
-                            "input_schema": json.dumps({
-                                "type": "object",
-                                "properties": {
-                                    "images": {
-                                        "type": "array",
-                                        "items": {"type": "string"}
-                                    }
-                                },
-                                "required": ["images"]
-                            }),
-                            "output_schema": json.dumps({
-                                "type": "object",
-                                "properties": {
-                                    "results": {"type": "array"},
-                                    "total_processing_time_ms": {"type": "number"}
-                                }
-                            }),
-                            "http_method": "POST",
-                            "accepts_file": False
-                        }
-                    ]
-                    
-                    registration_data = {
-                        "worker_id": self.worker_id,
-                        "worker_type": "python-vietocr",
-                        "capabilities": capabilities,
-                        "metadata": {
-                            "version": "1.0.0",
-                            "description": "VietOCR ONNX Worker - Vietnamese OCR",
-                            "language": "Vietnamese + English",
-                            "engine": "ONNX Runtime"
-                        }
-                    }
-                    
-                    register_msg = hub_pb2.Message(
-                        id=f"register-{int(time.time() * 1000000)}",
-                        to="hub",
-                        channel="system",
-                        content=json.dumps(registration_data),
-                        timestamp=datetime.now().isoformat(),
-                        type=hub_pb2.REGISTER
-                    )
-                    setattr(register_msg, 'from', self.worker_id)
-                    yield register_msg
-                    print(f"📤 Sent registration")
-                    
-                    # Keep generator alive
-                    while self.running:
-                        try:
-                            msg = send_queue.get(block=True, timeout=1.0)
-                            yield msg
-                        except:
-                            continue
-                            
-                except Exception as e:
-                    print(f"✗ Generator error: {e}")
-            
+
             # Start bidirectional streaming
             print(f"📡 Starting bidirectional stream...")
-            response_stream = self.stub.Connect(request_generator())
-            
+            call = self.stub.Connect(self._request_generator())
+
             print(f"✓ Registered with Hub as '{self.worker_id}'")
             print(f"📨 Listening for OCR requests...\n")
-            
+
             self.running = True
-            
-            # Receive loop
-            def receive_loop():
-                try:
-                    for msg in response_stream:
-                        if not self.running:
-                            break
-                        
-                        try:
-                            msg_from = getattr(msg, 'from')
-                            msg_type = msg.type
-                            
-                            print(f"📬 Received message:")
-                            print(f"   ID: {msg.id}")
-                            print(f"   From: {msg_from}")
-                            print(f"   Type: {msg_type}")
-                            print(f"   Channel: {msg.channel}")
-                            
-                            # Process request
-                            if msg_type == hub_pb2.REQUEST or msg_type == hub_pb2.WORKER_CALL:
-                                response_content = self.process_message(msg)
-                                
-                                response_msg = hub_pb2.Message(
-                                    id=f"resp-{int(time.time() * 1000000)}",
-                                    to=msg_from,
-                                    channel=msg.channel,
-                                    content=response_content,
-                                    timestamp=datetime.now().isoformat(),
-                                    type=hub_pb2.RESPONSE
-                                )
-                                setattr(response_msg, 'from', self.worker_id)
-                                send_queue.put(response_msg)
-                                print(f"   ✓ Queued response\n")
-                                
-                        except Exception as e:
-                            print(f"✗ Error processing message: {e}")
-                            
-                except Exception as e:
-                    print(f"✗ Receive loop error: {e}")
-                finally:
-                    self.running = False
-            
-            # Start receive thread
-            receive_thread = threading.Thread(target=receive_loop, daemon=True)
-            receive_thread.start()
-            
-            # Keep main thread alive
+            receive_task = asyncio.ensure_future(self._receive_loop(call))
+
+            # No sleep polling: wake immediately on stop() or stream death
             print("Worker running. Press Ctrl+C to stop.\n")
-            while self.running:
-                time.sleep(1)
-                
+            await self._shutdown.wait()
+            receive_task.cancel()
+
         except grpc.RpcError as e:
             print(f"\n✗ gRPC Error: {e.code()} - {e.details()}")
         except Exception as e:
@@ -351,11 +365,136 @@ class VietOCRWorker:
         finally:
             self.running = False
             if self.channel:
-                self.channel.close()
-    
+                await self.channel.close()
+
+    async def _request_generator(self):
+        """Yield the registration message, then drain the send queue"""
+        try:
+            # Send registration (content pre-serialized in __init__)
+            register_msg = hub_pb2.Message(
+                id=f"register-{self._id_prefix}{next(self._msg_seq)}",
+                to="hub",
+                channel="system",
+                content=self._registration_content,
+                timestamp=_now_iso(),
+                type=hub_pb2.REGISTER
+            )
+            setattr(register_msg, 'from', self.worker_id)
+            yield register_msg
+            print(f"📤 Sent registration")
+
+            # Keep generator alive. After each blocking get, drain
+            # whatever else is already queued (up to 64 messages) and
+            # yield the burst back-to-back: gRPC coalesces the
+            # consecutive writes into fewer HTTP/2 frames, which matters
+            # when a batch request fans out many small responses at once.
+            while True:
+                msg = await self.send_queue.get()
+                if msg is None:
+                    break
+                yield msg
+                for _ in range(63):
+                    try:
+                        msg = self.send_queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        break
+                    if msg is None:
+                        return
+                    yield msg
+
+        except Exception as e:
+            print(f"✗ Generator error: {e}")
+
+    async def _fetch_file(self, file_id):
+        """Pull a large image from the hub via the chunked DownloadFile
+        stream instead of receiving it inline as base64 in content.
+
+        Keeps individual Connect messages small (no max-message-size
+        bumps) and the 64KB-chunk transfer overlaps with other stream
+        traffic.
+        """
+        chunks = []
+        request = hub_pb2.FileDownloadRequest(
+            file_id=file_id,
+            chunk_size=256 * 1024
+        )
+        async for chunk in self.stub.DownloadFile(request):
+            chunks.append(chunk.data)
+        return b''.join(chunks)
+
+    async def _receive_loop(self, call):
+        """Handle incoming messages; OCR runs in a thread so the stream
+        reader keeps pulling while inference is in flight"""
+        loop = asyncio.get_event_loop()
+        try:
+            async for msg in call:
+                if not self.running:
+                    break
+
+                try:
+                    msg_from = getattr(msg, 'from')
+                    msg_type = msg.type
+
+                    print(f"📬 Received message:")
+                    print(f"   ID: {msg.id}")
+                    print(f"   From: {msg_from}")
+                    print(f"   Type: {msg_type}")
+                    print(f"   Channel: {msg.channel}")
+
+                    # Process request off the event loop; ORT releases
+                    # the GIL during Run so requests genuinely overlap
+                    if msg_type == hub_pb2.REQUEST or msg_type == hub_pb2.WORKER_CALL:
+                        # Resolve file references before dispatching so
+                        # handlers see the image in the payload field.
+                        # Any fetch failure must not escape this block:
+                        # the handler falls back to the inline content
+                        # and reports its own error, so the caller still
+                        # gets a response instead of silence.
+                        if msg.file_id and not msg.payload:
+                            try:
+                                msg.payload = await self._fetch_file(msg.file_id)
+                            except Exception as e:
+                                print(f"✗ File download failed ({msg.file_id}): {e}")
+
+                        response_content = await loop.run_in_executor(
+                            None, self.process_message, msg
+                        )
+
+                        response_msg = hub_pb2.Message(
+                            id=f"resp-{self._id_prefix}{next(self._msg_seq)}",
+                            to=msg_from,
+                            channel=msg.channel,
+                            content=response_content,
+                            timestamp=_now_iso(),
+                            type=hub_pb2.RESPONSE
+                        )
+                        setattr(response_msg, 'from', self.worker_id)
+                        await self.send_queue.put(response_msg)
+                        print(f"   ✓ Queued response\n")
+
+                except Exception as e:
+                    print(f"✗ Error processing message: {e}")
+
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            print(f"✗ Receive loop error: {e}")
+        finally:
+            self.running = False
+            if self._shutdown is not None:
+                self._shutdown.set()
+
     def stop(self):
         """Stop the worker"""
         self.running = False
+        if self._shutdown is not None:
+            self._shutdown.set()
+        if self.send_queue is not None:
+            # Wake up the request generator so it can exit
+            try:
+                self.send_queue.put_nowait(None)
+            except asyncio.QueueFull:
+                pass
 
 
 def main():
@@ -374,7 +513,7 @@ def main():
     )
     
     try:
-        worker.connect_and_run()
+        asyncio.run(worker.connect_and_run())
     except KeyboardInterrupt:
         print("\n\n✗ Shutting down...")
         worker.stop()
@@ -2,9 +2,10 @@
 Plugin Manager - Auto-discovers and loads all plugins
 """
 
+import json
 import os
 import sys
-import importlib
+import importlib.util
 import inspect
 from typing import Dict, List, Type
 from plugins.base_plugin import BasePlugin
@@ -22,6 +23,10 @@ class PluginManager:
         self.plugins_dir = plugins_dir or os.path.join(os.path.dirname(__file__), 'plugins')
         self.plugins: Dict[str, BasePlugin] = {}
         self.plugin_classes: Dict[str, Type[BasePlugin]] = {}
+        # Capability snapshot and its serialized form; the plugin set is
+        # fixed after load, so there is no need to rebuild these per call
+        self._capabilities_cache: List[dict] = None
+        self._capabilities_json: str = None
         
     def discover_plugins(self) -> List[str]:
         """
@@ -35,16 +40,23 @@ class PluginManager:
             return []
         
         discovered = []
-        
-        # Add plugins directory to Python path
-        if self.plugins_dir not in sys.path:
-            sys.path.insert(0, os.path.dirname(self.plugins_dir))
-        
-        for filename in os.listdir(self.plugins_dir):
-            if filename.endswith('_plugin.py') and not filename.startswith('_'):
-                module_name = filename[:-3]  # Remove .py
-                discovered.append(module_name)
-                
+
+        # No sys.path mutation here: plugins/ is a real package (it has
+        # an __init__.py and is imported for BasePlugin at module load),
+        # and load_plugin_module loads by file path with a qualified
+        # name. Every entry kept off sys.path shortens the linear scan
+        # Python does for all subsequent imports.
+
+        # scandir batches the directory read and answers is_file() from
+        # the dirent, avoiding a stat per entry
+        with os.scandir(self.plugins_dir) as entries:
+            for entry in entries:
+                filename = entry.name
+                if (filename.endswith('_plugin.py')
+                        and not filename.startswith('_')
+                        and entry.is_file()):
+                    discovered.append(filename[:-3])  # Remove .py
+
         return discovered
     
     def load_plugin_module(self, module_name: str) -> List[Type[BasePlugin]]:
@@ -58,16 +70,35 @@ class PluginManager:
             List of plugin classes found in the module
         """
         try:
-            # Import the module
+            # Load from the known file path directly: we already know
+            # where the module lives, so skip the sys.path/meta-path
+            # walk import_module would do. sys.modules still caches the
+            # result (and keeps relative imports between plugins
+            # working), so repeat loads are free.
             module_path = f"plugins.{module_name}"
-            module = importlib.import_module(module_path)
+            module = sys.modules.get(module_path)
+            if module is None:
+                spec = importlib.util.spec_from_file_location(
+                    module_path,
+                    os.path.join(self.plugins_dir, f"{module_name}.py")
+                )
+                module = importlib.util.module_from_spec(spec)
+                sys.modules[module_path] = module
+                try:
+                    spec.loader.exec_module(module)
+                except BaseException:
+                    sys.modules.pop(module_path, None)
+                    raise
             
-            # Find all classes that inherit from BasePlugin
+            # Find all classes that inherit from BasePlugin. Scanning
+            # the module dict directly skips the per-attribute getattr
+            # and sort that inspect.getmembers does.
             plugin_classes = []
-            for name, obj in inspect.getmembers(module, inspect.isclass):
-                if (issubclass(obj, BasePlugin) and 
-                    obj is not BasePlugin and 
-                    obj.__module__ == module_path):
+            for obj in vars(module).values():
+                if (isinstance(obj, type) and
+                        issubclass(obj, BasePlugin) and
+                        obj is not BasePlugin and
+                        obj.__module__ == module_path):
                     plugin_classes.append(obj)
             
             return plugin_classes
@@ -115,9 +146,58 @@ class PluginManager:
         
         # Also load worker-to-worker plugins
         self.load_worker_to_worker_plugins()
-        
+
+        # And plugins installed as packages (entry points)
+        self.load_entry_point_plugins()
+
+        # Warm the capability snapshot now that the plugin set is final
+        self.get_all_capabilities()
+
         print(f"✅ Successfully loaded {loaded_count} plugins\n")
         return self.plugins
+
+    def load_entry_point_plugins(self):
+        """
+        Load plugins advertised via the 'worker.capabilities' entry-point group
+
+        Lets plugins ship as installed packages instead of files dropped
+        into plugins/. Installed packages import through the normal
+        machinery, so they hit .pyc caches on cold start — faster than
+        re-parsing loose plugin files, which matters for frequently
+        rescheduled containers.
+        """
+        try:
+            from importlib.metadata import entry_points
+        except ImportError:  # Python < 3.8
+            return
+
+        try:
+            eps = entry_points(group='worker.capabilities')
+        except TypeError:  # Python < 3.10 returns a dict
+            eps = entry_points().get('worker.capabilities', [])
+
+        loaded_count = 0
+        for ep in eps:
+            try:
+                plugin_class = ep.load()
+                if not (inspect.isclass(plugin_class) and
+                        issubclass(plugin_class, BasePlugin) and
+                        plugin_class is not BasePlugin):
+                    print(f"  ⚠️  Entry point {ep.name} is not a BasePlugin subclass, skipping")
+                    continue
+
+                plugin_instance = plugin_class()
+                capability_name = plugin_instance.name
+                self.plugins[capability_name] = plugin_instance
+                self.plugin_classes[capability_name] = plugin_class
+                plugin_instance.on_load()
+                loaded_count += 1
+                print(f"  ✓ Loaded entry-point plugin: {plugin_class.__name__} → '{capability_name}'")
+            except Exception as e:
+                print(f"  ✗ Error loading entry point {ep.name}: {e}")
+
+        if loaded_count > 0:
+            print(f"✅ Loaded {loaded_count} entry-point plugins\n")
     
     def load_worker_to_worker_plugins(self):
         """Load plugins from worker-to-worker directory"""
@@ -127,11 +207,7 @@ class PluginManager:
             return
         
         print(f"\n🔄 Loading worker-to-worker plugins from: {worker_to_worker_dir}")
-        
-        # Add to path if needed
-        if worker_to_worker_dir not in sys.path:
-            sys.path.insert(0, worker_to_worker_dir)
-        
+
         loaded_count = 0
         for filename in os.listdir(worker_to_worker_dir):
             if filename.endswith('_plugin.py') and not filename.startswith('_'):
@@ -139,15 +215,17 @@ class PluginManager:
                 
                 try:
                     # Import from worker-to-worker directory
-                    import importlib.util
                     spec = importlib.util.spec_from_file_location(module_name, os.path.join(worker_to_worker_dir, filename))
                     if spec and spec.loader:
                         module = importlib.util.module_from_spec(spec)
                         spec.loader.exec_module(module)
                         
-                        # Find BasePlugin classes
-                        for name, obj in inspect.getmembers(module, inspect.isclass):
-                            if issubclass(obj, BasePlugin) and obj is not BasePlugin:
+                        # Find BasePlugin classes (module-dict scan, as
+                        # in load_plugin_module)
+                        for obj in vars(module).values():
+                            if (isinstance(obj, type) and
+                                    issubclass(obj, BasePlugin) and
+                                    obj is not BasePlugin):
                                 plugin_instance = obj()
                                 capability_name = plugin_instance.name
                                 self.plugins[capability_name] = plugin_instance
@@ -171,14 +249,21 @@ class PluginManager:
         Returns:
             List of capability dictionaries for registration with Hub
         """
+        if self._capabilities_cache is not None:
+            return self._capabilities_cache
+
         capabilities = []
-        
+
         for name, plugin in self.plugins.items():
+            # Schemas are stored pre-encoded as JSON strings and many
+            # plugins share fragments (the bare '{}' default above all);
+            # interning makes duplicates share one object so the
+            # snapshot holds each distinct schema once
             capability_meta = {
                 "name": plugin.name,
                 "description": plugin.description,
-                "input_schema": plugin.input_schema,
-                "output_schema": plugin.output_schema,
+                "input_schema": sys.intern(plugin.input_schema),
+                "output_schema": sys.intern(plugin.output_schema),
                 "http_method": plugin.http_method,
                 "accepts_file": plugin.accepts_file,
             }
@@ -187,8 +272,19 @@ class PluginManager:
                 capability_meta["file_field_name"] = plugin.file_field_name
             
             capabilities.append(capability_meta)
-        
+
+        self._capabilities_cache = capabilities
         return capabilities
+
+    def get_all_capabilities_json(self) -> str:
+        """Serialized form of get_all_capabilities, encoded once.
+
+        Registration code that only needs the JSON text can use this to
+        skip re-serializing the unchanged plugin metadata per reconnect.
+        """
+        if self._capabilities_json is None:
+            self._capabilities_json = json.dumps(self.get_all_capabilities())
+        return self._capabilities_json
     
     def execute_plugin(self, capability_name: str, params: dict, worker_sdk=None) -> dict:
         """
@@ -219,3 +315,5 @@ class PluginManager:
         
         self.plugins.clear()
         self.plugin_classes.clear()
+        self._capabilities_cache = None
+        self._capabilities_json = None
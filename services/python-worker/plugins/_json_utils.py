@@ -0,0 +1,53 @@
+"""
+Shared helpers for plugins: JSON conversion and response timestamps
+"""
+
+import time
+from datetime import datetime
+
+import numpy as np
+
+# The worker serializes responses with orjson when installed, whose
+# OPT_SERIALIZE_NUMPY handles numpy arrays/scalars in one C-level
+# encoding pass; convert_to_native is only needed for the stdlib-json
+# fallback
+try:
+    import orjson  # noqa: F401
+    NATIVE_NUMPY_JSON = True
+except ImportError:
+    NATIVE_NUMPY_JSON = False
+
+_NUMPY_TYPES = (np.ndarray, np.integer, np.floating)
+
+
+def convert_to_native(obj):
+    """Convert numpy types to Python native types.
+
+    The leading isinstance check returns plain scalars and strings
+    immediately, so recursion only happens on containers and actual
+    numpy values.
+    """
+    if not isinstance(obj, (dict, list) + _NUMPY_TYPES):
+        return obj
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.integer):
+        return int(obj)
+    if isinstance(obj, np.floating):
+        return float(obj)
+    if isinstance(obj, list):
+        return [convert_to_native(item) for item in obj]
+    return {key: convert_to_native(value) for key, value in obj.items()}
+
+
+def _now_iso(_cache=[0, '']):
+    """ISO timestamp memoized per second, same trick as the workers.
+
+    Shared here so each plugin doesn't carry its own copy of the cache
+    and the helper.
+    """
+    now = int(time.time())
+    if now != _cache[0]:
+        _cache[0] = now
+        _cache[1] = datetime.now().isoformat()
+    return _cache[1]
@@ -0,0 +1,46 @@
+"""
+Small FIFO result cache keyed by payload digest
+
+Retries, pagination and CDN previews routinely resend the exact same
+image; a hit here skips the whole detection + recognition pipeline.
+Keys are sha256 digests — CPython delegates to OpenSSL, which uses the
+SHA hardware instructions on modern x86/ARM, so hashing a multi-MB
+payload costs a few hundred microseconds against hundreds of ms of
+model inference.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+
+class ResultCache:
+    """Thread-safe bounded cache with FIFO eviction"""
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(data) -> bytes:
+        return hashlib.sha256(data).digest()
+
+    def get(self, key: bytes):
+        if self.max_entries <= 0:
+            return None
+        with self._lock:
+            return self._entries.get(key)
+
+    def put(self, key: bytes, value: dict):
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            if key not in self._entries:
+                while len(self._entries) >= self.max_entries:
+                    self._entries.popitem(last=False)
+                self._entries[key] = value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
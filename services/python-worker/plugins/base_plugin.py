@@ -4,39 +4,52 @@ All plugins must inherit from this class
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Any, ClassVar, Dict, Optional
 
 
 class BasePlugin(ABC):
     """
     Base class for all worker plugins
-    
+
     Each plugin represents one capability that the worker can perform.
     Simply create a new .py file in the plugins/ directory and define a class
     that inherits from BasePlugin.
     """
-    
+
+    # No per-instance __dict__: attribute reads on plugin instances
+    # become fixed-offset slot loads. Subclasses list their own
+    # instance attributes in __slots__ (an empty tuple when they keep
+    # no state).
+    __slots__ = ()
+
+    # Schemas are constant per plugin class; storing them as class
+    # attributes builds each string once at class creation instead of
+    # on every property call. Subclasses just set INPUT_SCHEMA /
+    # OUTPUT_SCHEMA (overriding the properties still works too).
+    INPUT_SCHEMA: ClassVar[str] = "{}"
+    OUTPUT_SCHEMA: ClassVar[str] = "{}"
+
     @property
     @abstractmethod
     def name(self) -> str:
         """Capability name (e.g., 'hello', 'process_image')"""
         pass
-    
+
     @property
     @abstractmethod
     def description(self) -> str:
         """Human-readable description of what this plugin does"""
         pass
-    
+
     @property
     def input_schema(self) -> str:
         """JSON schema for input validation (optional)"""
-        return "{}"
-    
+        return type(self).INPUT_SCHEMA
+
     @property
     def output_schema(self) -> str:
         """JSON schema for output format (optional)"""
-        return "{}"
+        return type(self).OUTPUT_SCHEMA
     
     @property
     def http_method(self) -> str:
@@ -3,29 +3,26 @@ Composite Task Plugin - Demonstrates worker-to-worker communication
 Calls Java worker to get file information
 """
 
-from datetime import datetime
 from plugins.base_plugin import BasePlugin
+from plugins._json_utils import _now_iso
 
 
 class CompositeTaskPlugin(BasePlugin):
     """Demo: Python processing + calls Java worker for file info"""
-    
+
+    __slots__ = ()
+
+    INPUT_SCHEMA = '{"type":"object","properties":{"file_path":{"type":"string"}}}'
+    OUTPUT_SCHEMA = '{"type":"object","properties":{"python_processing":{"type":"object"},"java_file_info":{"type":"object"}}}'
+
     @property
     def name(self) -> str:
         return "composite_task"
-    
+
     @property
     def description(self) -> str:
         return "Demo: Python processing + calls Java worker for file info"
-    
-    @property
-    def input_schema(self) -> str:
-        return '{"type":"object","properties":{"file_path":{"type":"string"}}}'
-    
-    @property
-    def output_schema(self) -> str:
-        return '{"type":"object","properties":{"python_processing":{"type":"object"},"java_file_info":{"type":"object"}}}'
-    
+
     def execute(self, params: dict, worker_sdk=None) -> dict:
         """Execute composite task with worker-to-worker call"""
         file_path = params.get('file_path', '/tmp/test.txt')
@@ -33,7 +30,7 @@ class CompositeTaskPlugin(BasePlugin):
         # Step 1: Do Python processing
         python_result = {
             "processed_by": "python",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
             "file_path": file_path
         }
         
@@ -58,13 +55,13 @@ class CompositeTaskPlugin(BasePlugin):
                 "python_processing": python_result,
                 "java_file_info": java_response,
                 "combined_status": "success",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _now_iso()
             }
-            
+
         except Exception as e:
             return {
                 "python_processing": python_result,
                 "java_call_error": str(e),
                 "combined_status": "partial",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _now_iso()
             }
@@ -2,28 +2,33 @@
 Hello Plugin - Simple greeting capability
 """
 
-from datetime import datetime
 from plugins.base_plugin import BasePlugin
+from plugins._json_utils import _now_iso
 
 
 class HelloPlugin(BasePlugin):
     """Simple hello world capability"""
-    
+
+    __slots__ = ('_body',)
+
+    OUTPUT_SCHEMA = '{"type":"object","properties":{"message":{"type":"string"}}}'
+
+    def __init__(self):
+        super().__init__()
+        # The message and status never change; only the timestamp is
+        # fresh per call, so keep the constant part prebuilt
+        self._body = {
+            "message": "Hello World from Python Worker! 🐍",
+            "status": "success"
+        }
+
     @property
     def name(self) -> str:
         return "hello"
-    
+
     @property
     def description(self) -> str:
         return "Returns a hello message"
-    
-    @property
-    def output_schema(self) -> str:
-        return '{"type":"object","properties":{"message":{"type":"string"}}}'
-    
+
     def execute(self, params: dict, worker_sdk=None) -> dict:
-        return {
-            "message": "Hello World from Python Worker! 🐍",
-            "timestamp": datetime.now().isoformat(),
-            "status": "success"
-        }
+        return {**self._body, "timestamp": _now_iso()}
@@ -1,5 +1,6 @@
 import os
 import sys
+import threading
 from typing import List, Dict, Tuple, Union, Optional
 from warnings import filterwarnings
 import cv2
@@ -11,6 +12,41 @@ from utils import util
 
 filterwarnings("ignore")
 
+# Process-wide engine instances, keyed by weights dir. Several plugins
+# (image analysis, VietOCR detection) use the same ONNX models; sharing
+# one engine means the sessions and weights are loaded from disk once
+# per process instead of once per plugin instance.
+_engines = {}
+_engines_lock = threading.Lock()
+
+
+def _precision_variant(model_path: str) -> str:
+    """Pick the *_fp16/_int8 sibling selected by OCR_PRECISION.
+
+    OCR_PRECISION in {fp32, fp16, int8} (default fp32). Lower-precision
+    siblings are produced offline by tools/quantize_weights.py; if the
+    requested variant is missing, fall back silently to the original so
+    a misconfigured env never breaks OCR.
+    """
+    precision = os.getenv('OCR_PRECISION', 'fp32').lower()
+    if precision == 'fp32':
+        return model_path
+    root, ext = os.path.splitext(model_path)
+    candidate = f"{root}_{precision}{ext}"
+    return candidate if os.path.exists(candidate) else model_path
+
+
+def get_engine(weights_dir: str = 'weights') -> 'paddlet_onnx':
+    """Lazy shared paddlet_onnx instance for the given weights dir"""
+    engine = _engines.get(weights_dir)
+    if engine is None:
+        with _engines_lock:
+            engine = _engines.get(weights_dir)
+            if engine is None:
+                engine = paddlet_onnx(weights_dir=weights_dir)
+                _engines[weights_dir] = engine
+    return engine
+
 
 class paddlet_onnx:
     """
@@ -41,12 +77,23 @@ class paddlet_onnx:
         if not os.path.exists(classification_path):
             raise FileNotFoundError(f"Classification model not found at {classification_path}")
         
-        # Initialize models
+        # Initialize models (swapping in quantized siblings when
+        # OCR_PRECISION asks for them)
         print(f"Initializing paddlet_onnx with weights from '{weights_dir}'...: {detection_path}")
-        self.detection = nn.Detection(detection_path)
-        self.recognition = nn.Recognition(recognition_path)
-        self.classification = nn.Classification(classification_path)
-        
+        self.detection = nn.Detection(_precision_variant(detection_path))
+        self.recognition = nn.Recognition(_precision_variant(recognition_path))
+        self.classification = nn.Classification(_precision_variant(classification_path))
+        
+        # Warm the detection session so the first real request doesn't
+        # pay provider initialization / kernel selection (opt out with
+        # OCR_WARMUP=0)
+        if os.getenv('OCR_WARMUP', '1') != '0':
+            try:
+                dummy = np.full((64, 64, 3), 255, dtype=np.uint8)
+                self.detection(dummy)
+            except Exception as e:
+                print(f"⚠️  Warmup inference failed: {e}")
+
         print(f"✓ paddlet_onnx initialized successfully!")
         print(f"  - Weights directory: {weights_dir}")
     
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+One-time weight conversion for the PaddleOCR ONNX models.
+
+Produces *_fp16.onnx and *_int8.onnx siblings next to the originals in
+plugins/weights/; paddlet_onnx picks them up at runtime when
+OCR_PRECISION=fp16 or OCR_PRECISION=int8 is set.
+
+- fp16 halves weight memory and bandwidth (pays off on GPUs with tensor
+  cores); needs the onnxconverter-common package.
+- int8 dynamic quantization targets the matmul-heavy recognition model
+  on x86 CPUs with VNNI; needs onnxruntime's quantization extras.
+
+Usage:
+    python tools/quantize_weights.py [weights_dir]
+"""
+
+import os
+import sys
+
+MODELS = ('detection.onnx', 'recognition.onnx', 'classification.onnx')
+
+
+def convert_fp16(model_path: str, out_path: str):
+    import onnx
+    from onnxconverter_common import float16
+
+    model = onnx.load(model_path)
+    model = float16.convert_float_to_float16(model, keep_io_types=True)
+    onnx.save(model, out_path)
+
+
+def convert_int8(model_path: str, out_path: str):
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    quantize_dynamic(model_path, out_path, weight_type=QuantType.QInt8)
+
+
+def main():
+    weights_dir = sys.argv[1] if len(sys.argv) > 1 else os.path.join(
+        os.path.dirname(__file__), '..', 'plugins', 'weights'
+    )
+
+    for name in MODELS:
+        model_path = os.path.join(weights_dir, name)
+        if not os.path.exists(model_path):
+            print(f"⚠️  Skipping {name}: not found in {weights_dir}")
+            continue
+
+        root, ext = os.path.splitext(model_path)
+
+        for suffix, convert in (('fp16', convert_fp16), ('int8', convert_int8)):
+            out_path = f"{root}_{suffix}{ext}"
+            try:
+                convert(model_path, out_path)
+                print(f"✓ {name} → {os.path.basename(out_path)}")
+            except ImportError as e:
+                print(f"⚠️  Skipping {suffix} for {name}: {e}")
+            except Exception as e:
+                print(f"✗ Failed {suffix} for {name}: {e}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,15 +1,27 @@
 """
 Composite Plugin - Demonstrates Python worker calling other workers
 """
+from concurrent.futures import ThreadPoolExecutor
+
 from plugins.base_plugin import BasePlugin
 import json
 
+# The three downstream calls are independent network round-trips, so
+# total latency should be the slowest call, not the sum of all three
+_CALLS = [
+    ("java-simple-worker", "hello_world", {}),
+    ("node-worker", "hello_node", {"name": "from Python"}),
+    ("go-worker", "hello_go", {"name": "from Python"}),
+]
+
 
 class CompositeTaskPlugin(BasePlugin):
     """
     Composite task that calls multiple workers (Java, Node.js, Go)
     """
 
+    __slots__ = ()
+
     def get_name(self):
         return "python_composite"
 
@@ -25,77 +37,36 @@ class CompositeTaskPlugin(BasePlugin):
             "calls": []
         }
 
-        # Call Java worker
-        try:
-            print("  → Calling Java worker (hello_world)...")
-            java_response = context["call_worker"](
-                "java-simple-worker",
-                "hello_world",
-                {},
-                timeout=10000
-            )
-            results["calls"].append({
-                "worker": "java-simple-worker",
-                "capability": "hello_world",
-                "status": "success",
-                "response": java_response
-            })
-        except Exception as e:
-            print(f"  ✗ Java worker call failed: {e}")
-            results["calls"].append({
-                "worker": "java-simple-worker",
-                "capability": "hello_world",
-                "status": "error",
-                "error": str(e)
-            })
+        call_worker = context["call_worker"]
 
-        # Call Node.js worker
-        try:
-            print("  → Calling Node.js worker (hello_node)...")
-            node_response = context["call_worker"](
-                "node-worker",
-                "hello_node",
-                {"name": "from Python"},
-                timeout=10000
-            )
-            results["calls"].append({
-                "worker": "node-worker",
-                "capability": "hello_node",
-                "status": "success",
-                "response": node_response
-            })
-        except Exception as e:
-            print(f"  ✗ Node.js worker call failed: {e}")
-            results["calls"].append({
-                "worker": "node-worker",
-                "capability": "hello_node",
-                "status": "error",
-                "error": str(e)
-            })
+        # Fire all calls concurrently; each one is GIL-releasing network
+        # I/O waiting on a remote worker. Results are collected in
+        # submission order so the output stays deterministic.
+        with ThreadPoolExecutor(max_workers=len(_CALLS)) as executor:
+            futures = [
+                executor.submit(call_worker, worker, capability, call_params,
+                                timeout=10000)
+                for worker, capability, call_params in _CALLS
+            ]
 
-        # Call Go worker
-        try:
-            print("  → Calling Go worker (hello_go)...")
-            go_response = context["call_worker"](
-                "go-worker",
-                "hello_go",
-                {"name": "from Python"},
-                timeout=10000
-            )
-            results["calls"].append({
-                "worker": "go-worker",
-                "capability": "hello_go",
-                "status": "success",
-                "response": go_response
-            })
-        except Exception as e:
-            print(f"  ✗ Go worker call failed: {e}")
-            results["calls"].append({
-                "worker": "go-worker",
-                "capability": "hello_go",
-                "status": "error",
-                "error": str(e)
-            })
+            for (worker, capability, _), future in zip(_CALLS, futures):
+                try:
+                    print(f"  → Calling {worker} ({capability})...")
+                    response = future.result()
+                    results["calls"].append({
+                        "worker": worker,
+                        "capability": capability,
+                        "status": "success",
+                        "response": response
+                    })
+                except Exception as e:
+                    print(f"  ✗ {worker} call failed: {e}")
+                    results["calls"].append({
+                        "worker": worker,
+                        "capability": capability,
+                        "status": "error",
+                        "error": str(e)
+                    })
 
         # Summary
         success_count = sum(1 for call in results["calls"] if call["status"] == "success")
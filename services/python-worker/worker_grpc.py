@@ -4,23 +4,94 @@ Python Worker - Real gRPC Client
 Connects to gRPC Hub using compiled proto files
 """
 
+import asyncio
 import grpc
+import itertools
 import json
 import time
 import sys
 import os
 import uuid
 import threading
+import traceback
 from datetime import datetime
 
 # Import generated proto files
 import hub_pb2
 import hub_pb2_grpc
 
+# orjson on the per-message hot path (3-10x stdlib json); optional, so
+# fall back to stdlib when not installed. Registration stays on stdlib
+# json since it runs once per connect.
+try:
+    import orjson
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+
+def _now_iso(_cache=[0, '']):
+    """ISO timestamp memoized per second.
+
+    datetime.now().isoformat() costs a syscall plus string formatting
+    per call; the hub only needs second granularity, so reformat at
+    most once a second.
+    """
+    now = int(time.time())
+    if now != _cache[0]:
+        _cache[0] = now
+        _cache[1] = datetime.now().isoformat()
+    return _cache[1]
+
 
 class PythonWorker:
     """Worker that connects to gRPC Hub via bidirectional streaming"""
     
+    # Static portion of the demo analysis result; built once so each
+    # request only fills in the per-call keys instead of rebuilding the
+    # nested dict
+    _ANALYSIS_STATIC = {
+        "detected_objects": ["person", "car", "tree"],
+        "confidence": 0.85,
+        "colors": ["blue", "green", "red"],
+        "dimensions": "estimated 1920x1080"
+    }
+
+    # Capabilities are static; the list used to be rebuilt (in two
+    # diverging copies) inside both generators on every connect
+    _CAPABILITIES = [
+        {
+            "name": "hello",
+            "description": "Returns a hello message",
+            "input_schema": "{}",
+            "output_schema": "{\"type\":\"object\",\"properties\":{\"message\":{\"type\":\"string\"}}}",
+            "http_method": "POST",
+            "accepts_file": False
+        },
+        {
+            "name": "analyze_image",
+            "description": "Analyzes an image and returns information",
+            "input_schema": "{\"type\":\"object\",\"properties\":{\"file\":{\"type\":\"string\",\"format\":\"binary\"}}}",
+            "output_schema": "{\"type\":\"object\",\"properties\":{\"result\":{\"type\":\"string\"}}}",
+            "http_method": "POST",
+            "accepts_file": True,
+            "file_field_name": "file"
+        },
+        {
+            "name": "composite_task",
+            "description": "Demo: Python processing + calls Java worker for file info",
+            "input_schema": "{\"type\":\"object\",\"properties\":{\"file_path\":{\"type\":\"string\"}}}",
+            "output_schema": "{\"type\":\"object\",\"properties\":{\"python_processing\":{\"type\":\"object\"},\"java_file_info\":{\"type\":\"object\"}}}",
+            "http_method": "POST",
+            "accepts_file": False
+        }
+    ]
+
     def __init__(self, worker_id='python-worker', hub_address='localhost:50051'):
         self.worker_id = worker_id
         self.hub_address = hub_address
@@ -29,7 +100,43 @@ class PythonWorker:
         self.running = False
         self.pending_calls = {}  # Track pending worker-to-worker calls
         self.pending_lock = threading.Lock()  # Thread-safe access
-        
+        self.send_queue = None
+        self._loop = None
+        # Message ids come from a counter behind a random per-process
+        # prefix: one integer increment per message instead of a
+        # time.time() call, float multiply and int conversion, and ids
+        # stay unique across restarts and duplicate worker ids
+        self._msg_seq = itertools.count()
+        self._id_prefix = f"{worker_id}-{uuid.uuid4().hex[:8]}-"
+
+        # Registration never changes for the lifetime of the worker, so
+        # serialize it once and keep a protobuf template; reconnects
+        # CopyFrom the template and stamp only id/timestamp instead of
+        # rebuilding the dict and re-serializing JSON each time
+        self._register_template = hub_pb2.Message(
+            to="hub",
+            channel="system",
+            content=json.dumps({
+                "worker_id": self.worker_id,
+                "worker_type": "python",
+                "capabilities": self._CAPABILITIES,
+                "metadata": {
+                    "version": "1.0.0",
+                    "description": "Python worker with image analysis"
+                }
+            }),
+            type=hub_pb2.REGISTER
+        )
+        setattr(self._register_template, 'from', self.worker_id)
+
+    def _make_register_msg(self):
+        """Stamp a fresh id/timestamp onto the cached registration"""
+        msg = hub_pb2.Message()
+        msg.CopyFrom(self._register_template)
+        msg.id = f"register-{self._id_prefix}{next(self._msg_seq)}"
+        msg.timestamp = _now_iso()
+        return msg
+
     def handle_hello(self, msg):
         """Handle hello request"""
         msg_from = getattr(msg, 'from')
@@ -37,12 +144,12 @@ class PythonWorker:
         
         response_data = {
             "message": "Hello World from Python Worker! 🐍",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _now_iso(),
             "worker_id": self.worker_id,
             "status": "success"
         }
         
-        return json.dumps(response_data)
+        return _json_dumps(response_data)
     
     def handle_image_analysis(self, msg):
         """Handle image analysis request"""
@@ -50,7 +157,7 @@ class PythonWorker:
         print(f"  → Processing image analysis from {msg_from}")
         
         try:
-            content = json.loads(msg.content)
+            content = _json_loads(msg.content)
             filename = content.get('filename', 'unknown')
             size = content.get('size', 0)
             
@@ -59,19 +166,14 @@ class PythonWorker:
                 "size_bytes": size,
                 "size_mb": round(size / (1024 * 1024), 2),
                 "format": filename.split('.')[-1].upper() if '.' in filename else "UNKNOWN",
-                "analysis": {
-                    "detected_objects": ["person", "car", "tree"],
-                    "confidence": 0.85,
-                    "colors": ["blue", "green", "red"],
-                    "dimensions": "estimated 1920x1080"
-                },
+                "analysis": self._ANALYSIS_STATIC,
                 "processing_time_ms": 150,
                 "worker_id": self.worker_id,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _now_iso(),
                 "status": "success"
             }
             
-            return json.dumps(response_data)
+            return _json_dumps(response_data)
             
         except Exception as e:
             error_data = {
@@ -79,7 +181,7 @@ class PythonWorker:
                 "status": "failed",
                 "worker_id": self.worker_id
             }
-            return json.dumps(error_data)
+            return _json_dumps(error_data)
     
     def handle_composite_task(self, msg):
         """
@@ -90,13 +192,13 @@ class PythonWorker:
         print(f"  → Processing composite task from {msg_from}")
         
         try:
-            content = json.loads(msg.content)
+            content = _json_loads(msg.content)
             file_path = content.get('file_path', '/tmp/test.txt')
             
             # Step 1: Do Python processing
             python_result = {
                 "processed_by": "python",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _now_iso(),
                 "file_path": file_path
             }
             
@@ -116,10 +218,10 @@ class PythonWorker:
                     "java_file_info": java_response,
                     "combined_status": "success",
                     "worker_id": self.worker_id,
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": _now_iso()
                 }
                 
-                return json.dumps(response_data)
+                return _json_dumps(response_data)
                 
             except Exception as e:
                 # If Java worker call fails, still return partial result
@@ -128,9 +230,9 @@ class PythonWorker:
                     "java_call_error": str(e),
                     "combined_status": "partial",
                     "worker_id": self.worker_id,
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": _now_iso()
                 }
-                return json.dumps(response_data)
+                return _json_dumps(response_data)
             
         except Exception as e:
             error_data = {
@@ -138,7 +240,7 @@ class PythonWorker:
                 "status": "failed",
                 "worker_id": self.worker_id
             }
-            return json.dumps(error_data)
+            return _json_dumps(error_data)
     
     def call_worker(self, target_worker, capability, params, timeout=30):
         """
@@ -157,7 +259,7 @@ class PythonWorker:
             TimeoutError: If no response within timeout
             Exception: If error response received
         """
-        if not hasattr(self, 'send_queue'):
+        if not self.send_queue:
             raise RuntimeError("Worker not connected. Call connect_and_run() first")
         
         request_id = str(uuid.uuid4())
@@ -169,8 +271,8 @@ class PythonWorker:
             id=request_id,
             to=target_worker,
             channel=capability,
-            content=json.dumps(params),
-            timestamp=datetime.now().isoformat(),
+            content=_json_dumps(params),
+            timestamp=_now_iso(),
             type=hub_pb2.WORKER_CALL  # Use new message type
         )
         setattr(call_msg, 'from', self.worker_id)
@@ -189,8 +291,9 @@ class PythonWorker:
             print(f"  → Total pending calls after register: {len(self.pending_calls)}")
             print(f"  → All pending call IDs: {list(self.pending_calls.keys())}")
         
-        # Send the call
-        self.send_queue.put(call_msg)
+        # Send the call (thread-safe: this runs on an executor thread,
+        # the queue lives on the event loop)
+        self._loop.call_soon_threadsafe(self.send_queue.put_nowait, call_msg)
         print(f"  → Sent WORKER_CALL message with ID {request_id}")
         
         # Wait for response directly (no separate thread needed)
@@ -222,7 +325,7 @@ class PythonWorker:
                 # Found matching pending call
                 call_info = self.pending_calls[request_id]
                 try:
-                    response_content = json.loads(msg.content)
+                    response_content = _json_loads(msg.content)
                     call_info['data']['response'] = response_content
                     call_info['event'].set()
                     print(f"  ✓ Matched and completed pending call {request_id}")
@@ -258,7 +361,7 @@ class PythonWorker:
                 "error": f"Unknown request type: {channel}",
                 "status": "failed"
             }
-            return json.dumps(error)
+            return _json_dumps(error)
     
     def create_response(self, request_msg, content):
         """Create response message"""
@@ -268,290 +371,194 @@ class PythonWorker:
             to=request_msg.from_,
             channel=request_msg.channel,
             content=content,
-            timestamp=datetime.now().isoformat(),
+            timestamp=_now_iso(),
             type=hub_pb2.DIRECT
         )
     
-    def message_generator(self, stream):
-        """Generate messages to send to hub"""
-        # First message: register with worker ID and capabilities
-        capabilities = [
-            {
-                "name": "hello",
-                "description": "Simple hello world response",
-                "input_schema": "{}",
-                "output_schema": "{\"message\": \"string\"}",
-                "http_method": "GET",
-                "accepts_file": False
-            },
-            {
-                "name": "analyze_image",
-                "description": "Analyze uploaded image",
-                "input_schema": "{\"image\": \"file\"}",
-                "output_schema": "{\"analysis\": \"string\", \"dimensions\": \"object\"}",
-                "http_method": "POST",
-                "accepts_file": True,
-                "file_field_name": "image"
-            }
-        ]
-        
-        registration_data = {
-            "worker_id": self.worker_id,
-            "worker_type": "python",
-            "capabilities": capabilities,
-            "metadata": {
-                "version": "1.0.0",
-                "description": "Python worker with image analysis"
-            }
-        }
-        
-        register_msg = hub_pb2.Message(
-            id=f"register-{int(time.time() * 1000000)}",
-            from_=self.worker_id,
-            to="hub",
-            channel="system",
-            content=json.dumps(registration_data),
-            timestamp=datetime.now().isoformat(),
-            type=hub_pb2.REGISTER
-        )
-        
-        print(f"📤 Sending registration message")
-        yield register_msg
-        
-        # Process incoming messages and send responses
+    async def _request_generator(self):
+        """Yield the registration message, then drain the send queue"""
         try:
-            for response_msg in stream:
-                if response_msg:
-                    yield response_msg
+            yield self._make_register_msg()
+            print(f"📤 Sent registration message")
+
+            # Block until there is something to send; stop() enqueues a
+            # None sentinel, so the generator sleeps fully when idle
+            # instead of waking every second on a timeout just to loop
+            while True:
+                msg = await self.send_queue.get()
+                if msg is None:
+                    break
+                yield msg
+                # Drain whatever else queued up meanwhile (bounded) and
+                # yield the burst back-to-back so gRPC coalesces the
+                # consecutive writes into fewer HTTP/2 frames instead of
+                # one wakeup round trip per response
+                for _ in range(63):
+                    try:
+                        msg = self.send_queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        break
+                    if msg is None:
+                        return
+                    yield msg
+
         except Exception as e:
-            print(f"✗ Generator error: {e}")
-    
-    def connect_and_run(self):
-        """Connect to gRPC Hub and start processing"""
+            print(f"Generator error: {e}")
+            traceback.print_exc()
+        finally:
+            print("Generator exiting...")
+
+    async def _handle(self, msg, msg_from, msg_type):
+        """Process one request off the event loop and queue the reply"""
+        try:
+            # Handlers are sync and handle_composite_task blocks on a
+            # worker-to-worker response, so they must not run on the
+            # event loop: the loop has to stay free to receive that very
+            # response. The default thread pool keeps them off it.
+            response_content = await self._loop.run_in_executor(
+                None, self.process_message, msg
+            )
+
+            response_msg = hub_pb2.Message(
+                id=f"resp-{self._id_prefix}{next(self._msg_seq)}",
+                to=msg_from,
+                channel=msg.channel,
+                content=response_content,
+                timestamp=_now_iso(),
+                type=hub_pb2.RESPONSE
+            )
+            setattr(response_msg, 'from', self.worker_id)
+            self.send_queue.put_nowait(response_msg)
+            print(f"   ✓ Queued response for {msg_from}\n")
+        except Exception as e:
+            print(f"✗ Error processing message: {e}")
+            traceback.print_exc()
+
+    async def _receive_loop(self, call):
+        """Handle incoming messages from the hub stream"""
+        try:
+            async for msg in call:
+                if not self.running:
+                    break
+
+                try:
+                    msg_from = getattr(msg, 'from')  # Get 'from' field
+                    msg_type = msg.type
+
+                    print(f"📬 Received message:")
+                    print(f"   ID: {msg.id}")
+                    print(f"   From: {msg_from}")
+                    print(f"   Type: {msg_type}")
+                    print(f"   Channel: {msg.channel}")
+
+                    # Handle different message types
+                    if msg_type == hub_pb2.RESPONSE:
+                        # This is a response (possibly from worker-to-worker call)
+                        print(f"   → Response message")
+                        self._handle_worker_call_response(msg)
+                        # Don't send another response for RESPONSE messages
+                        continue
+
+                    # Fan each request out as its own task so the reader
+                    # keeps pulling from the stream while handlers run
+                    asyncio.create_task(self._handle(msg, msg_from, msg_type))
+
+                except Exception as e:
+                    print(f"✗ Error processing message: {e}")
+                    traceback.print_exc()
+
+        except asyncio.CancelledError:
+            pass
+        except grpc.RpcError as e:
+            if e.code() == grpc.StatusCode.CANCELLED:
+                print("Stream cancelled")
+            else:
+                print(f"✗ gRPC Error: {e.code()} - {e.details()}")
+        except Exception as e:
+            print(f"✗ Receive loop error: {e}")
+            traceback.print_exc()
+        finally:
+            self.running = False
+            print("Receive loop exiting...")
+
+    async def connect_and_run(self):
+        """Connect to gRPC Hub and start processing (grpc.aio)"""
         print(f"🐍 Python Worker (gRPC)")
         print(f"=" * 50)
         print(f"Worker ID: {self.worker_id}")
         print(f"Hub Address: {self.hub_address}")
         print(f"=" * 50)
-        
+
+        self._loop = asyncio.get_event_loop()
+        self.send_queue = asyncio.Queue()
+
         try:
-            # Create channel
+            # Create channel. All traffic rides one bidi stream (the hub
+            # keys streams by worker id, so a channel pool with parallel
+            # Connect streams would just register duplicates); instead
+            # tune the single connection: keepalives hold it open across
+            # idle gaps, the local subchannel pool keeps this process's
+            # TCP connection separate from any other channel to the same
+            # target, and the 16MB caps match the hub's limits.
             print(f"Connecting to gRPC Hub...")
-            self.channel = grpc.insecure_channel(self.hub_address)
-            
-            # Wait for channel to be ready
-            grpc.channel_ready_future(self.channel).result(timeout=10)
+            self.channel = grpc.aio.insecure_channel(
+                self.hub_address,
+                options=[
+                    ('grpc.use_local_subchannel_pool', 1),
+                    ('grpc.keepalive_time_ms', 30000),
+                    ('grpc.keepalive_timeout_ms', 10000),
+                    ('grpc.keepalive_permit_without_calls', 1),
+                    ('grpc.http2.max_pings_without_data', 0),
+                    ('grpc.max_send_message_length', 16 * 1024 * 1024),
+                    ('grpc.max_receive_message_length', 16 * 1024 * 1024),
+                ],
+            )
+            await asyncio.wait_for(self.channel.channel_ready(), timeout=10)
             print(f"✓ Connected to Hub")
-            
+
             # Create stub
             self.stub = hub_pb2_grpc.HubServiceStub(self.channel)
-            
-            # Create message queue for sending
-            import queue
-            import threading
-            send_queue = queue.Queue()
-            self.send_queue = send_queue  # Make accessible for call_worker method
-            
-            # Generator function for sending messages
-            def request_generator():
-                try:
-                    # Send registration message first
-                    capabilities = [
-                        {
-                            "name": "hello",
-                            "description": "Returns a hello message",
-                            "input_schema": "{}",
-                            "output_schema": "{\"type\":\"object\",\"properties\":{\"message\":{\"type\":\"string\"}}}",
-                            "http_method": "POST",
-                            "accepts_file": False
-                        },
-                        {
-                            "name": "analyze_image",
-                            "description": "Analyzes an image and returns information",
-                            "input_schema": "{\"type\":\"object\",\"properties\":{\"file\":{\"type\":\"string\",\"format\":\"binary\"}}}",
-                            "output_schema": "{\"type\":\"object\",\"properties\":{\"result\":{\"type\":\"string\"}}}",
-                            "http_method": "POST",
-                            "accepts_file": True,
-                            "file_field_name": "file"
-                        },
-                        {
-                            "name": "composite_task",
-                            "description": "Demo: Python processing + calls Java worker for file info",
-                            "input_schema": "{\"type\":\"object\",\"properties\":{\"file_path\":{\"type\":\"string\"}}}",
-                            "output_schema": "{\"type\":\"object\",\"properties\":{\"python_processing\":{\"type\":\"object\"},\"java_file_info\":{\"type\":\"object\"}}}",
-                            "http_method": "POST",
-                            "accepts_file": False
-                        }
-                    ]
-                    
-                    registration_data = {
-                        "worker_id": self.worker_id,
-                        "worker_type": "python",
-                        "capabilities": capabilities,
-                        "metadata": {
-                            "version": "1.0.0",
-                            "description": "Python worker with image analysis"
-                        }
-                    }
-                    
-                    register_msg = hub_pb2.Message(
-                        id=f"register-{int(time.time() * 1000000)}",
-                        to="hub",
-                        channel="system",
-                        content=json.dumps(registration_data),
-                        timestamp=datetime.now().isoformat(),
-                        type=hub_pb2.REGISTER
-                    )
-                    # Set 'from' field using setattr since 'from' is a Python keyword
-                    setattr(register_msg, 'from', self.worker_id)
-                    yield register_msg
-                    print(f"📤 Sent registration message")
-                    
-                    # Keep generator alive by continuously yielding messages
-                    # Use blocking get() to wait for messages instead of timeout
-                    while self.running:
-                        try:
-                            # Block until we have a message to send
-                            # This keeps the generator alive without busy waiting
-                            msg = send_queue.get(block=True, timeout=1.0)
-                            yield msg
-                        except queue.Empty:
-                            # No message within timeout, continue loop
-                            # This is normal - keeps generator alive
-                            continue
-                        except Exception as e:
-                            print(f"Error in generator: {e}")
-                            break
-                            
-                except Exception as e:
-                    print(f"Generator error: {e}")
-                    import traceback
-                    traceback.print_exc()
-                finally:
-                    print("Generator exiting...")
-            
+
+            self.running = True
+
             # Start bidirectional streaming
             print(f"📡 Starting bidirectional stream...")
-            response_stream = self.stub.Connect(request_generator())
-            
+            call = self.stub.Connect(self._request_generator())
+
             print(f"✓ Registered with Hub as '{self.worker_id}'")
             print(f"📨 Listening for requests...\n")
-            
-            self.running = True
-            
-            # Thread for receiving messages
-            def receive_loop():
-                try:
-                    for msg in response_stream:
-                        if not self.running:
-                            break
-                            
-                        try:
-                            msg_from = getattr(msg, 'from')  # Get 'from' field
-                            msg_type = msg.type
-                            
-                            print(f"📬 Received message:")
-                            print(f"   ID: {msg.id}")
-                            print(f"   From: {msg_from}")
-                            print(f"   Type: {msg_type}")
-                            print(f"   Channel: {msg.channel}")
-                            
-                            # Handle different message types
-                            if msg_type == hub_pb2.RESPONSE:
-                                # This is a response (possibly from worker-to-worker call)
-                                print(f"   → Response message")
-                                self._handle_worker_call_response(msg)
-                                # Don't send another response for RESPONSE messages
-                                continue
-                                
-                            elif msg_type == hub_pb2.WORKER_CALL:
-                                # Another worker is calling us
-                                print(f"   → Worker call from {msg_from}")
-                                # Process and send response
-                                response_content = self.process_message(msg)
-                                
-                                response_msg = hub_pb2.Message(
-                                    id=f"resp-{int(time.time() * 1000000)}",
-                                    to=msg_from,
-                                    channel=msg.channel,
-                                    content=response_content,
-                                    timestamp=datetime.now().isoformat(),
-                                    type=hub_pb2.RESPONSE  # Mark as RESPONSE
-                                )
-                                setattr(response_msg, 'from', self.worker_id)
-                                send_queue.put(response_msg)
-                                print(f"   ✓ Queued response for worker call\n")
-                                
-                            else:
-                                # Regular REQUEST or other message types
-                                print(f"   → Regular request")
-                                response_content = self.process_message(msg)
-                                
-                                response_msg = hub_pb2.Message(
-                                    id=f"resp-{int(time.time() * 1000000)}",
-                                    to=msg_from,
-                                    channel=msg.channel,
-                                    content=response_content,
-                                    timestamp=datetime.now().isoformat(),
-                                    type=hub_pb2.RESPONSE
-                                )
-                                setattr(response_msg, 'from', self.worker_id)
-                                send_queue.put(response_msg)
-                                print(f"   ✓ Queued response for {msg_from}\n")
-                            
-                        except Exception as e:
-                            print(f"✗ Error processing message: {e}")
-                            import traceback
-                            traceback.print_exc()
-                            
-                except grpc.RpcError as e:
-                    if e.code() == grpc.StatusCode.CANCELLED:
-                        print("Stream cancelled")
-                    else:
-                        print(f"✗ gRPC Error: {e.code()} - {e.details()}")
-                except Exception as e:
-                    print(f"✗ Receive loop error: {e}")
-                    import traceback
-                    traceback.print_exc()
-                finally:
-                    self.running = False
-                    print("Receive loop exiting...")
-            
-            # Start receive thread
-            receive_thread = threading.Thread(target=receive_loop, daemon=True)
-            receive_thread.start()
-            
-            # Keep main thread alive
+
             print("Worker running. Press Ctrl+C to stop.\n")
-            while self.running:
-                time.sleep(1)
-                    
+            await self._receive_loop(call)
+
         except grpc.RpcError as e:
             print(f"\n✗ gRPC Error: {e.code()} - {e.details()}")
         except Exception as e:
             print(f"\n✗ Connection error: {e}")
-            import traceback
             traceback.print_exc()
         finally:
             self.running = False
             if self.channel:
-                self.channel.close()
+                await self.channel.close()
                 print("\n✗ Disconnected from Hub")
-    
+
     def stop(self):
         """Stop the worker"""
         self.running = False
+        if self.send_queue is not None and self._loop is not None:
+            # Wake up the request generator so it can exit
+            self._loop.call_soon_threadsafe(self.send_queue.put_nowait, None)
 
 
 def main():
     # Get configuration from environment variables
     worker_id = os.getenv('WORKER_ID', 'python-worker')
     hub_address = os.getenv('HUB_ADDRESS', 'localhost:50051')
-    
+
     worker = PythonWorker(worker_id=worker_id, hub_address=hub_address)
-    
+
     try:
-        worker.connect_and_run()
+        asyncio.run(worker.connect_and_run())
     except KeyboardInterrupt:
         print("\n\n✗ Shutting down...")
         worker.stop()
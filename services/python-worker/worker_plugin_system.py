@@ -4,15 +4,18 @@ Python Worker with Plugin System
 Auto-discovers and loads all plugins from plugins/ directory
 """
 
+import asyncio
 import grpc
+import itertools
 import json
+import logging
 import time
 import sys
 import os
 import uuid
 import threading
-import queue
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 # Import generated proto files
@@ -22,6 +25,70 @@ import hub_pb2_grpc
 # Import plugin system
 from plugin_manager import PluginManager
 
+# Per-message tracing goes through logging (debug level, %s-style args)
+# so production runs skip both the string formatting and the write
+# syscall each flushed print would cost on the hot path
+logger = logging.getLogger('worker_plugin_system')
+logging.basicConfig(level=os.getenv('LOG_LEVEL', 'INFO').upper())
+
+def _now_iso(_cache=[0, '']):
+    """ISO timestamp memoized per second.
+
+    datetime.now().isoformat() costs a syscall plus string formatting
+    per call; the hub only needs second granularity, so reformat at
+    most once a second.
+    """
+    now = int(time.time())
+    if now != _cache[0]:
+        _cache[0] = now
+        _cache[1] = datetime.now().isoformat()
+    return _cache[1]
+
+
+# orjson on the per-message hot path (3-10x stdlib json); optional, so
+# fall back to stdlib when not installed. Registration stays on stdlib
+# json since it runs once per connect.
+try:
+    import orjson
+
+    # OPT_SERIALIZE_NUMPY encodes numpy arrays/scalars in one C-level
+    # pass, so plugins returning OCR results can skip their Python-level
+    # convert-to-native tree walk
+    _ORJSON_OPTS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=_ORJSON_OPTS).decode()
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+# Optional compiled schema validation. fastjsonschema code-generates a
+# dedicated validation function per schema at load time, so the
+# per-request cost is one function call instead of re-walking the
+# schema; jsonschema's precompiled Draft7Validator is the slower
+# fallback. With neither installed, validation is skipped (the
+# historical behaviour).
+try:
+    import fastjsonschema
+
+    def _compile_validator(schema):
+        return fastjsonschema.compile(schema)
+except ImportError:
+    try:
+        from jsonschema import Draft7Validator
+
+        def _compile_validator(schema):
+            validator = Draft7Validator(schema)
+
+            def _validate(payload):
+                validator.validate(payload)
+                return payload
+            return _validate
+    except ImportError:
+        _compile_validator = None
+
 
 class PluginWorker:
     """Worker that uses plugin system for capability management"""
@@ -33,7 +100,20 @@ class PluginWorker:
         self.stub = None
         self.running = False
         self.send_queue = None
-        
+        self._shutdown = None
+        # Event loop reference so executor threads (plugin handlers,
+        # call_worker) can enqueue sends thread-safely
+        self._loop = None
+        # Monotonic message ids: time.time()*1e6 can collide within one
+        # clock tick; the uuid fragment keeps ids unique across restarts
+        self._msg_seq = itertools.count()
+        self._id_prefix = f"{worker_id}-{uuid.uuid4().hex[:8]}-"
+        # Response skeleton: the constant fields (type, from) are set
+        # once and copied into each outgoing response; CopyFrom of a
+        # small message is cheaper than re-setting them per request
+        self._response_template = hub_pb2.Message(type=hub_pb2.RESPONSE)
+        setattr(self._response_template, 'from', worker_id)
+
         # Worker-to-worker call tracking
         self.pending_calls = {}
         self.pending_lock = threading.Lock()
@@ -41,14 +121,65 @@ class PluginWorker:
         # Plugin system
         self.plugin_manager = PluginManager()
         self.plugins = {}
-        
+        # Compiled input validators, keyed by capability name
+        self._validators = {}
+        # Flat capability -> bound execute dispatch, built at load
+        self._handlers = {}
+        # Serialized registration payload, built once in load_plugins
+        self._registration_content = None
+        self._capability_count = 0
+
     def load_plugins(self):
         """Auto-discover and load all plugins"""
         self.plugins = self.plugin_manager.load_all_plugins()
-        
+
         if not self.plugins:
             print("⚠️  No plugins loaded! Worker will have no capabilities.")
-        
+
+        # Compile each plugin's input schema once, at load time, so the
+        # per-request path is a single call on the compiled validator
+        if _compile_validator is not None:
+            for name, plugin in self.plugins.items():
+                try:
+                    schema = json.loads(plugin.input_schema or '{}')
+                except (ValueError, TypeError):
+                    continue
+                # Empty/propertyless schemas accept everything; nothing
+                # to validate
+                if not isinstance(schema, dict) or not schema.get('properties'):
+                    continue
+                try:
+                    self._validators[name] = _compile_validator(schema)
+                except Exception as e:
+                    print(f"  ⚠️  Could not compile schema for '{name}': {e}")
+
+        # Specialize one wrapper per capability: the capability name,
+        # bound execute method and compiled validator are loop-invariant,
+        # so close over them here instead of looking them up per request.
+        # process_message is then a single dict hit plus one call.
+        self._handlers = {
+            name: self._specialize_handler(
+                name, plugin.execute, self._validators.get(name)
+            )
+            for name, plugin in self.plugins.items()
+        }
+
+        # Registration payload is constant once plugins are loaded;
+        # serialize it a single time so every (re)connect reuses the
+        # string instead of re-encoding all capability schemas
+        capabilities = self.plugin_manager.get_all_capabilities()
+        self._registration_content = json.dumps({
+            "worker_id": self.worker_id,
+            "worker_type": "python",
+            "capabilities": capabilities,
+            "metadata": {
+                "version": "2.0.0",
+                "description": "Python worker with plugin system",
+                "plugin_count": len(self.plugins)
+            }
+        })
+        self._capability_count = len(capabilities)
+
         return self.plugins
     
     def call_worker(self, target_worker, capability, params, timeout=30):
@@ -75,8 +206,8 @@ class PluginWorker:
             id=request_id,
             to=target_worker,
             channel=capability,
-            content=json.dumps(params),
-            timestamp=datetime.now().isoformat(),
+            content=_json_dumps(params),
+            timestamp=_now_iso(),
             type=hub_pb2.WORKER_CALL
         )
         setattr(call_msg, 'from', self.worker_id)
@@ -92,9 +223,10 @@ class PluginWorker:
                 'data': response_data
             }
         
-        # Send the call
-        self.send_queue.put(call_msg)
-        
+        # Send the call (thread-safe: this runs on an executor thread,
+        # the queue lives on the event loop)
+        self._loop.call_soon_threadsafe(self.send_queue.put_nowait, call_msg)
+
         # Wait for response
         if response_event.wait(timeout=timeout):
             with self.pending_lock:
@@ -117,195 +249,132 @@ class PluginWorker:
             if request_id and request_id in self.pending_calls:
                 call_info = self.pending_calls[request_id]
                 try:
-                    response_content = json.loads(msg.content)
+                    response_content = _json_loads(msg.content)
                     call_info['data']['response'] = response_content
                     call_info['event'].set()
                 except Exception as e:
                     call_info['data']['error'] = f"Failed to parse response: {e}"
                     call_info['event'].set()
     
+    def _specialize_handler(self, capability_name, execute, validator):
+        """Build the per-capability fast path, bound once at load time.
+
+        Parsing, validation, execution and response encoding for one
+        capability are fused into a single closure so the per-request
+        work is one call with everything invariant already resolved.
+        """
+        worker = self
+
+        def _run(content):
+            try:
+                # Parse input parameters
+                try:
+                    params = _json_loads(content) if content else {}
+                except:
+                    params = {}
+
+                # Validate against the precompiled schema (no-op when no
+                # validator library is installed)
+                if validator is not None:
+                    try:
+                        validator(params)
+                    except Exception as e:
+                        return _json_dumps({
+                            "error": f"Invalid input: {e}",
+                            "status": "failed",
+                            "capability": capability_name
+                        })
+
+                # Execute plugin (pass worker as worker_sdk for
+                # worker-to-worker calls)
+                result = execute(params, worker_sdk=worker)
+
+                return _json_dumps(result)
+
+            except Exception as e:
+                print(f"  ✗ Plugin execution error: {e}")
+                traceback.print_exc()
+
+                return _json_dumps({
+                    "error": str(e),
+                    "status": "failed",
+                    "capability": capability_name
+                })
+
+        return _run
+
     def process_message(self, msg):
         """Process incoming message using plugin system"""
         capability_name = msg.channel
-        
-        print(f"  → Processing capability: {capability_name}")
-        
-        # Get plugin for this capability
-        plugin = self.plugin_manager.get_plugin(capability_name)
-        
-        if plugin is None:
+
+        logger.debug("processing capability %s", capability_name)
+
+        # Single flat lookup straight to the specialized wrapper
+        handler = self._handlers.get(capability_name)
+
+        if handler is None:
             error_data = {
                 "error": f"Unknown capability: {capability_name}",
                 "status": "failed"
             }
-            return json.dumps(error_data)
-        
-        try:
-            # Parse input parameters
-            try:
-                params = json.loads(msg.content) if msg.content else {}
-            except:
-                params = {}
-            
-            # Execute plugin (pass self as worker_sdk for worker-to-worker calls)
-            result = plugin.execute(params, worker_sdk=self)
-            
-            return json.dumps(result)
-            
-        except Exception as e:
-            print(f"  ✗ Plugin execution error: {e}")
-            traceback.print_exc()
-            
-            error_data = {
-                "error": str(e),
-                "status": "failed",
-                "capability": capability_name
-            }
-            return json.dumps(error_data)
+            return _json_dumps(error_data)
+
+        return handler(msg.content)
     
-    def connect_and_run(self):
-        """Connect to Hub and start processing messages"""
+    async def connect_and_run(self):
+        """Connect to Hub and start processing messages (grpc.aio)"""
         # Load plugins first
         self.load_plugins()
-        
+
+        self._loop = asyncio.get_event_loop()
+        self.send_queue = asyncio.Queue()
+        self._shutdown = asyncio.Event()
+        # Handlers run on this pool, one task per inbound message, so a
+        # slow plugin never stalls the stream reader; sized for mostly
+        # I/O-bound work (cv2/onnxruntime release the GIL anyway)
+        self._executor = ThreadPoolExecutor(
+            max_workers=min(32, (os.cpu_count() or 4) * 4),
+            thread_name_prefix='plugin-exec'
+        )
+
         try:
             print(f"Connecting to gRPC Hub...")
-            self.channel = grpc.insecure_channel(self.hub_address)
-            grpc.channel_ready_future(self.channel).result(timeout=10)
+            # Long-lived stream carrying many small messages: keepalive
+            # pings keep the connection alive through idle periods and
+            # NAT/proxy timeouts (no reconnect + re-registration churn),
+            # and the raised message caps leave headroom for batched or
+            # image-carrying payloads. Mirrors the vietocr worker.
+            self.channel = grpc.aio.insecure_channel(
+                self.hub_address,
+                options=[
+                    ('grpc.keepalive_time_ms', 30000),
+                    ('grpc.keepalive_timeout_ms', 10000),
+                    ('grpc.keepalive_permit_without_calls', 1),
+                    ('grpc.http2.max_pings_without_data', 0),
+                    ('grpc.max_send_message_length', 16 * 1024 * 1024),
+                    ('grpc.max_receive_message_length', 16 * 1024 * 1024),
+                ],
+            )
+            await asyncio.wait_for(self.channel.channel_ready(), timeout=10)
             print(f"✓ Connected to Hub")
-            
+
             self.stub = hub_pb2_grpc.HubServiceStub(self.channel)
-            
-            # Create message queue
-            send_queue = queue.Queue()
-            self.send_queue = send_queue
-            
-            # Generator function for sending messages
-            def request_generator():
-                try:
-                    # Send registration
-                    capabilities = self.plugin_manager.get_all_capabilities()
-                    
-                    registration_data = {
-                        "worker_id": self.worker_id,
-                        "worker_type": "python",
-                        "capabilities": capabilities,
-                        "metadata": {
-                            "version": "2.0.0",
-                            "description": "Python worker with plugin system",
-                            "plugin_count": len(self.plugins)
-                        }
-                    }
-                    
-                    register_msg = hub_pb2.Message(
-                        id=f"register-{int(time.time() * 1000000)}",
-                        to="hub",
-                        channel="system",
-                        content=json.dumps(registration_data),
-                        timestamp=datetime.now().isoformat(),
-                        type=hub_pb2.REGISTER
-                    )
-                    setattr(register_msg, 'from', self.worker_id)
-                    yield register_msg
-                    print(f"📤 Sent registration with {len(capabilities)} capabilities")
-                    
-                    # Keep generator alive
-                    while self.running:
-                        try:
-                            msg = send_queue.get(timeout=1)
-                            yield msg
-                        except queue.Empty:
-                            continue
-                            
-                except Exception as e:
-                    print(f"Generator error: {e}")
-                    traceback.print_exc()
-            
+
             # Start bidirectional streaming
             print(f"📡 Starting bidirectional stream...")
-            response_stream = self.stub.Connect(request_generator())
-            
+            call = self.stub.Connect(self._request_generator())
+
             print(f"✓ Registered with Hub as '{self.worker_id}'")
             print(f"📨 Listening for requests with {len(self.plugins)} plugins loaded...\n")
-            
+
             self.running = True
-            
-            # Receive loop
-            def receive_loop():
-                try:
-                    for msg in response_stream:
-                        if not self.running:
-                            break
-                        
-                        try:
-                            msg_from = getattr(msg, 'from')
-                            msg_type = msg.type
-                            
-                            print(f"📬 Received message:")
-                            print(f"   From: {msg_from}, Type: {msg_type}, Channel: {msg.channel}")
-                            
-                            # Handle different message types
-                            if msg_type == hub_pb2.RESPONSE:
-                                self._handle_worker_call_response(msg)
-                                continue
-                            
-                            elif msg_type == hub_pb2.WORKER_CALL:
-                                # Another worker calling us
-                                print(f"   → Worker-to-worker call")
-                                response_content = self.process_message(msg)
-                                
-                                response_msg = hub_pb2.Message(
-                                    id=f"resp-{int(time.time() * 1000000)}",
-                                    to=msg_from,
-                                    channel=msg.channel,
-                                    content=response_content,
-                                    timestamp=datetime.now().isoformat(),
-                                    type=hub_pb2.RESPONSE
-                                )
-                                setattr(response_msg, 'from', self.worker_id)
-                                response_msg.metadata['request_id'] = msg.id
-                                send_queue.put(response_msg)
-                                print(f"   ✓ Queued response\n")
-                            
-                            else:
-                                # Regular REQUEST
-                                print(f"   → Regular request")
-                                response_content = self.process_message(msg)
-                                
-                                response_msg = hub_pb2.Message(
-                                    id=f"resp-{int(time.time() * 1000000)}",
-                                    to=msg_from,
-                                    channel=msg.channel,
-                                    content=response_content,
-                                    timestamp=datetime.now().isoformat(),
-                                    type=hub_pb2.RESPONSE
-                                )
-                                setattr(response_msg, 'from', self.worker_id)
-                                send_queue.put(response_msg)
-                                print(f"   ✓ Queued response\n")
-                        
-                        except Exception as e:
-                            print(f"✗ Error processing message: {e}")
-                            traceback.print_exc()
-                
-                except grpc.RpcError as e:
-                    if e.code() != grpc.StatusCode.CANCELLED:
-                        print(f"✗ gRPC Error: {e.code()} - {e.details()}")
-                except Exception as e:
-                    print(f"✗ Receive loop error: {e}")
-                    traceback.print_exc()
-                finally:
-                    self.running = False
-            
-            # Start receive thread
-            receive_thread = threading.Thread(target=receive_loop, daemon=True)
-            receive_thread.start()
-            
-            # Keep main thread alive
+            receive_task = asyncio.ensure_future(self._receive_loop(call))
+
+            # No sleep polling: wake immediately on stop() or stream death
             print("Worker running. Press Ctrl+C to stop.\n")
-            while self.running:
-                time.sleep(1)
-        
+            await self._shutdown.wait()
+            receive_task.cancel()
+
         except grpc.RpcError as e:
             print(f"\n✗ gRPC Error: {e.code()} - {e.details()}")
         except Exception as e:
@@ -314,9 +383,127 @@ class PluginWorker:
         finally:
             self.running = False
             if self.channel:
-                self.channel.close()
+                await self.channel.close()
+            self._executor.shutdown(wait=False)
             self.plugin_manager.unload_all_plugins()
 
+    async def _request_generator(self):
+        """Yield the registration message, then drain the send queue"""
+        try:
+            # Send registration (content pre-serialized in load_plugins)
+            register_msg = hub_pb2.Message(
+                id=f"register-{self._id_prefix}{next(self._msg_seq)}",
+                to="hub",
+                channel="system",
+                content=self._registration_content,
+                timestamp=_now_iso(),
+                type=hub_pb2.REGISTER
+            )
+            setattr(register_msg, 'from', self.worker_id)
+            yield register_msg
+            print(f"📤 Sent registration with {self._capability_count} capabilities")
+
+            # Keep generator alive. After each blocking get, drain
+            # whatever else is queued (up to 64 messages) and yield the
+            # burst back-to-back so gRPC coalesces the consecutive
+            # writes into fewer HTTP/2 frames — matters when a burst of
+            # calls fans out many small responses at once.
+            while True:
+                msg = await self.send_queue.get()
+                if msg is None:
+                    break
+                yield msg
+                for _ in range(63):
+                    try:
+                        msg = self.send_queue.get_nowait()
+                    except asyncio.QueueEmpty:
+                        break
+                    if msg is None:
+                        return
+                    yield msg
+
+        except Exception as e:
+            print(f"Generator error: {e}")
+            traceback.print_exc()
+
+    async def _dispatch(self, msg, msg_from, msg_type):
+        """Run one message's handler on the pool and enqueue the reply"""
+        try:
+            # Plugins are sync and possibly blocking; keep them off the
+            # event loop
+            response_content = await self._loop.run_in_executor(
+                self._executor, self.process_message, msg
+            )
+
+            # Copy the prebuilt skeleton (type, from) and assign only
+            # the varying fields via the C-level setters
+            response_msg = hub_pb2.Message()
+            response_msg.CopyFrom(self._response_template)
+            response_msg.id = f"resp-{self._id_prefix}{next(self._msg_seq)}"
+            response_msg.to = msg_from
+            response_msg.channel = msg.channel
+            response_msg.content = response_content
+            response_msg.timestamp = _now_iso()
+            if msg_type == hub_pb2.WORKER_CALL:
+                response_msg.metadata['request_id'] = msg.id
+            await self.send_queue.put(response_msg)
+            logger.debug("queued response id=%s", response_msg.id)
+        except Exception:
+            logger.exception("Error processing message")
+
+    async def _receive_loop(self, call):
+        """Handle incoming messages; plugin execution runs in a thread
+        so the stream reader keeps pulling while handlers work"""
+        try:
+            async for msg in call:
+                if not self.running:
+                    break
+
+                try:
+                    msg_from = getattr(msg, 'from')
+                    msg_type = msg.type
+
+                    logger.debug(
+                        "recv id=%s from=%s type=%s chan=%s",
+                        msg.id, msg_from, msg_type, msg.channel
+                    )
+
+                    # Handle different message types
+                    if msg_type == hub_pb2.RESPONSE:
+                        self._handle_worker_call_response(msg)
+                        continue
+
+                    # Fan each request out as its own task on the
+                    # handler pool: the reader keeps pulling from the
+                    # stream while slow plugins run, so one long OCR
+                    # call no longer caps throughput at 1/its latency
+                    asyncio.ensure_future(self._dispatch(msg, msg_from, msg_type))
+
+                except Exception:
+                    logger.exception("Error processing message")
+
+        except asyncio.CancelledError:
+            pass
+        except grpc.RpcError as e:
+            if e.code() != grpc.StatusCode.CANCELLED:
+                print(f"✗ gRPC Error: {e.code()} - {e.details()}")
+        except Exception as e:
+            print(f"✗ Receive loop error: {e}")
+            traceback.print_exc()
+        finally:
+            self.running = False
+            if self._shutdown is not None:
+                self._shutdown.set()
+
+    def stop(self):
+        """Stop the worker"""
+        self.running = False
+        if self._shutdown is not None:
+            self._shutdown.set()
+        if self.send_queue is not None and self._loop is not None:
+            # Wake up the request generator so it can exit
+            self._loop.call_soon_threadsafe(self.send_queue.put_nowait, None)
+
 
 def main():
     print("🐍 Python Worker (Plugin System)")
@@ -332,10 +519,10 @@ def main():
     worker = PluginWorker(worker_id, hub_address)
     
     try:
-        worker.connect_and_run()
+        asyncio.run(worker.connect_and_run())
     except KeyboardInterrupt:
         print("\n\n✗ Shutting down...")
-        worker.running = False
+        worker.stop()
 
 
 if __name__ == '__main__':
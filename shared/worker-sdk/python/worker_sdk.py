@@ -50,6 +50,11 @@ class WorkerSDK(ABC):
         # Capability registry
         self.capabilities = {}
         self.capability_handlers: Dict[str, Callable] = {}
+        # Serialized registration payload, built on first use. Schemas
+        # are already stored pre-encoded as JSON strings, so the whole
+        # registration content is constant once capabilities are
+        # registered — reconnects reuse the cached string.
+        self._registration_content: Optional[str] = None
         
         # Worker-to-worker call tracking
         self.pending_calls = {}
@@ -110,7 +115,8 @@ class WorkerSDK(ABC):
         }
         if file_field_name:
             self.capabilities[name]["file_field_name"] = file_field_name
-        
+        self._registration_content = None
+
         self.log(f"✓ Registered capability: {name}")
     
     def call_worker(
@@ -229,23 +235,22 @@ class WorkerSDK(ABC):
     
     def _send_registration(self):
         """Internal: Send registration message to Hub"""
-        capabilities_list = list(self.capabilities.values())
-        
-        registration_data = {
-            "worker_id": self.worker_id,
-            "worker_type": self.worker_type,
-            "capabilities": capabilities_list,
-            "metadata": {
-                "version": "1.0.0",
-                "sdk_version": "2.0.0"
-            }
-        }
-        
+        if self._registration_content is None:
+            self._registration_content = json.dumps({
+                "worker_id": self.worker_id,
+                "worker_type": self.worker_type,
+                "capabilities": list(self.capabilities.values()),
+                "metadata": {
+                    "version": "1.0.0",
+                    "sdk_version": "2.0.0"
+                }
+            })
+
         register_msg = self.hub_pb2.Message(
             id=f"register-{int(time.time() * 1000000)}",
             to="hub",
             channel="system",
-            content=json.dumps(registration_data),
+            content=self._registration_content,
             timestamp=datetime.now().isoformat(),
             type=self.hub_pb2.REGISTER
         )